@@ -0,0 +1,67 @@
+from const import Const
+from sim_clock import SimClock
+
+
+class Animation:
+    """
+    The one clock of all animations. Rather than every sprite checking the time whenever it is drawn, each one that
+    animates is kept in a timer wheel, in the slot of the tick its next frame is due at, and by every tick only the
+    sprites of that slot are advanced. Sprites animated together, like an invader formation, share one entry.
+    An animated object has an animate() method, which advances its frame and schedules the next one,
+    and a next_frame attribute holding the tick it is due at, so that an entry it was rescheduled from is left out.
+    """
+
+    wheel = [[] for _ in range(Const.ANIMATION_WHEEL_SIZE)]
+    done = 0  # The last tick advanced by
+
+    @staticmethod
+    def schedule(animated, seconds):
+        """
+        Animate an object once the given time has passed, on the tick that falls on, but not before the next one.
+        Any earlier schedule of it is replaced.
+        """
+        due = SimClock.ticks + Animation.ticks(seconds)
+        animated.next_frame = due
+        Animation.wheel[due % Const.ANIMATION_WHEEL_SIZE].append((due, animated))
+
+    @staticmethod
+    def ticks(seconds):
+        """
+        Return the number of ticks a frame is shown for, at least one
+        """
+        return max(1, round(seconds * Const.TICK_RATE))
+
+    @staticmethod
+    def cancel(animated):
+        """
+        Stop animating an object. Its entries are left in the wheel, and skipped when they are due.
+        """
+        animated.next_frame = 0
+
+    @staticmethod
+    def clear():
+        """
+        Stop animating everything
+        """
+        for entries in Animation.wheel:
+            entries.clear()
+
+    @staticmethod
+    def advance():
+        """
+        Animate the objects due by the ticks since the last call
+        """
+        wheel = Animation.wheel
+        while Animation.done < SimClock.ticks:
+            Animation.done += 1
+            tick = Animation.done
+            slot = tick % Const.ANIMATION_WHEEL_SIZE
+            entries = wheel[slot]
+            if not entries:
+                continue
+            # Objects due a turn of the wheel later stay in the slot
+            wheel[slot] = [entry for entry in entries if entry[0] != tick]
+            for due, animated in entries:
+                if due == tick and animated.next_frame == due:
+                    animated.next_frame = 0
+                    animated.animate()
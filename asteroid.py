@@ -1,12 +1,30 @@
 from math import copysign
-from random import randint
+from rng import Rng
 from const import Const
 from enemy import Enemy
-from time import perf_counter as clock
+from frame_cache import FrameCache
+from interstellar import Interstellar
+from motion import Motion
+from sim_clock import SimClock
+from animation import Animation
 
 
 class Asteroid(Enemy):
-    def __init__(self, images, speed, acceleration, x=0, y=0):
+    """
+    An asteroid flies straight at a constant speed, so it is moved by its Motion rather than tick by tick.
+    Its position is worked out whenever it is read, which takes several times as long as reading an attribute.
+    It also spins at a constant pace, so its frame is told from the ticks too, and only its explosion is animated.
+    """
+    __slots__ = ("acceleration", "motion", "origin_x", "origin_y", "start", "version",
+                 "spin_start", "spin_ticks", "spin_step")
+    # All asteroids of a similar size share the same rescaled frames
+    frame_cache = FrameCache(bucket=Const.ASTEROID_SIZE_BUCKET, capacity=Const.ASTEROID_CACHE_SIZE)
+
+    def __init__(self, images, speed, acceleration, x=0, y=0, motion=None):
+        self.motion = motion if motion is not None else Motion()
+        self.origin_x, self.origin_y = 0, 0
+        self.start = self.motion.tick
+        self.version = 0
         super().__init__(images=images, speed=speed, x=x, y=y)
         self.__set_asteroid_random_size()
         self.current_image_set = self.images
@@ -18,6 +36,37 @@ class Asteroid(Enemy):
         self.score = int(self.original_images[0].get_rect().size[0] - self.width) * 10  # More score for small ones
         # Animation speed is affected by the asteroid's vertical speed
         self.frame_time = (1 - self.speed[1] / Const.ASTEROID_SPEED_VERTICAL_MAX) / Const.ASTEROID_ANIMATE_COEFFICIENT
+        self.spin_start = SimClock.ticks
+        self.spin_ticks = Animation.ticks(self.frame_time)
+        # Chose animation direction by the asteroid's horizontal direction
+        self.spin_step = int(copysign(1, self.speed[0] + self.acceleration[0]))
+        self.motion.schedule(self)
+
+    @property
+    def x(self):
+        """
+        The position where the asteroid started, moved by its speed for every tick since
+        """
+        return self.origin_x + self.speed[0] * (self.motion.tick - self.start)
+
+    @x.setter
+    def x(self, x):
+        self.origin_y = self.y
+        self.origin_x = x
+        self.start = self.motion.tick
+
+    @property
+    def y(self):
+        """
+        See x
+        """
+        return self.origin_y + self.speed[1] * (self.motion.tick - self.start)
+
+    @y.setter
+    def y(self, y):
+        self.origin_x = self.x
+        self.origin_y = y
+        self.start = self.motion.tick
 
     def __set_asteroid_random_size(self):
         """
@@ -26,26 +75,99 @@ class Asteroid(Enemy):
         orig_width, _ = self.original_images[0].get_rect().size
         # Alter the original size only if the current size is above the minimum
         if Const.ASTEROID_MIN_SIZE < orig_width:
-            new_size = randint(Const.ASTEROID_MIN_SIZE, orig_width)  # Assuming the asteroids are square images
-            self.images = self.rescale(images_source=self.original_images, scale_x=new_size, scale_y=new_size)
+            # Assuming the asteroids are square images
+            new_size = Rng.gameplay.randint(Const.ASTEROID_MIN_SIZE, orig_width)
+            self.images = Asteroid.frame_cache.scaled(images=self.original_images, width=new_size, height=new_size)
+
+    def departure(self):
+        """
+        Return the tick at which the asteroid is off the screen, see Interstellar.off_the_screen(), None if never.
+        The position is checked after each tick the asteroid has moved by, and it is off the screen from the first
+        one on which it is beyond any of the sides.
+        """
+        if self.allow_off_the_screen:
+            return None
+        after = self.motion.tick - self.start
+        steps = [Motion.crossing(self.origin_x, self.speed[0], Const.OFF_THE_SCREEN_RIGHT, after),
+                 Motion.crossing(self.origin_y, self.speed[1], Const.OFF_THE_SCREEN_BOTTOM, after),
+                 Motion.crossing(-self.origin_x - self.width, -self.speed[0], -Const.OFF_THE_SCREEN_LEFT, after),
+                 Motion.crossing(-self.origin_y - self.height, -self.speed[1], -Const.OFF_THE_SCREEN_TOP, after)]
+        steps = [step for step in steps if step is not None]
+        return self.start + min(steps) if steps else None
+
+    def depart(self):
+        """
+        The asteroid has left the screen, and stays where it left it, the way it did when moved tick by tick
+        """
+        self.away = True
+        self.stop()
+
+    def set_xy(self, x, y):
+        """
+        Set the position, from which the asteroid moves on
+        """
+        super().set_xy(x, y)
+        self.motion.schedule(self)
+
+    def move(self):
+        """
+        The asteroid has already moved with its Motion, and is set away by it, only move its hitbox
+        """
+        Interstellar.move(self)
+
+    def hit(self):
+        """
+        Cause the asteroid to become hit, which changes its size and position
+        """
+        super().hit()
+        self.motion.schedule(self)
+
+    def get_drawn_xy(self):
+        """
+        The asteroid moves at a constant speed, so it was back by its speed at the last tick
+        """
+        back = 1 - SimClock.alpha
+        return self.x - self.speed[0] * back, self.y - self.speed[1] * back
+
+    def stop(self):
+        """
+        Stay where the asteroid is, as it is gone
+        """
+        self.x = self.x
+        self.speed = (0, 0)
+        self.motion.cancel(self)
+
+    def get_mask(self):
+        """
+        Return the mask of the current frame and its position, None while exploding
+        """
+        if self.exploding:
+            return None
+        return Asteroid.frame_cache.mask(self.images[self.get_frame_num()]), (int(self.x), int(self.y))
+
+    def get_frame_num(self):
+        """
+        Return the number of the current picture. Until hit the asteroid turns one picture every spin_ticks ticks,
+        starting from frame_num, so it needs no animating.
+        """
+        if self.exploding:
+            return self.frame_num
+        turns = (SimClock.ticks - self.spin_start) // self.spin_ticks
+        return (self.frame_num + self.spin_step * turns) % self.num_of_images
+
+    def animate(self):
+        """
+        Advance the explosion, see Animation
+        """
+        if self.frame_num < self.num_of_explosion_frames:
+            self.frame_num += 1
+            Animation.schedule(self, self.frame_time)
+        else:
+            self.away = True
+            self.stop()
 
     def get_current_pic(self):
         """
         Return the current picture.
         """
-        # Change the picture
-        if clock() > self.next_frame:
-            if self.exploding:
-                if self.frame_num < self.num_of_explosion_frames:
-                    self.frame_num += 1
-                else:
-                    self.away = True
-            else:
-                # Chose animation direction by the asteroid's horizontal direction
-                self.frame_num += int(copysign(1, self.speed[0]+self.acceleration[0]))
-                if self.frame_num >= self.num_of_images:
-                    self.frame_num = 0
-                elif self.frame_num < 0:
-                    self.frame_num = self.num_of_images - 1
-            self.next_frame = clock() + self.frame_time
-        return self.current_image_set[self.frame_num]
+        return self.current_image_set[self.get_frame_num()]
@@ -0,0 +1,659 @@
+import os
+import sys
+import tracemalloc
+from math import copysign
+from random import Random
+from time import perf_counter as clock
+
+# Benchmarks don't need a window or sound, and must run on a machine without them
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from const import Const
+from resources import Resources
+from asteroid import Asteroid
+from invader import Invader
+from rocket import Rocket
+from utils import Utils
+from sprite_sheet import SpriteSheet
+from bundle import Bundle
+from collision import Collision
+from projectile import Projectile
+from enemies import Enemies
+from formation import Formation
+from star import Star
+from spaceship import Spaceship
+from interstellar import Interstellar
+from direction import Direction
+from motion import Motion
+from screen import Screen
+from sim_clock import SimClock
+from animation import Animation
+from rng import Rng
+
+
+class Benchmark:
+    """
+    Performance measurements of the game internals.
+    To run all of them type "python benchmark.py", or give the names of the ones needed.
+    """
+
+    all = ["blit", "asteroids", "invaders", "rocket_atlas", "startup", "preload", "collisions", "allocations", "masks",
+           "chain", "slots", "removal", "motion", "interpolation", "animation"]
+
+    @staticmethod
+    def timeit(function, repeat=1000):
+        """
+        Return the average run time of a function in microseconds
+        """
+        start = clock()
+        for _ in range(repeat):
+            function()
+        return (clock() - start) / repeat * 1000000
+
+    @staticmethod
+    def blit():
+        """
+        Blit time of every frame set, as decoded versus prepared for the display
+        """
+        window = pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        print("Blit time per frame, microseconds")
+        for name, mode in Resources.formats.items():
+            if name == "planets":
+                # Planets are drawn premultiplied after being rotozoomed, see Planet
+                mode = Resources.PREMULTIPLIED
+            raw = [pygame.image.load(path) for path in Resources.manifest[name]]
+            prepared = [Resources.prepare(image, mode) for image in raw]
+            flags = Resources.blit_flags(mode)
+            raw_time = Benchmark.timeit(lambda: [window.blit(image, (10, 10)) for image in raw]) / len(raw)
+            prepared_time = Benchmark.timeit(lambda: [window.blit(image, (10, 10), special_flags=flags)
+                                                      for image in prepared]) / len(prepared)
+            print("%-16s %-14s raw %8.2f  prepared %8.2f  gain x%.1f" %
+                  (name, mode, raw_time, prepared_time, raw_time / prepared_time))
+
+    @staticmethod
+    def asteroids():
+        """
+        Asteroid spawn time with the shared frame cache, versus rescaling the frames for every asteroid
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+
+        def spawn():
+            Asteroid(images=Resources.asteroid1, speed=(0, 1), acceleration=(0, 0))
+
+        Asteroid.frame_cache.clear()
+        cached_time = Benchmark.timeit(spawn)
+        hits, misses = Asteroid.frame_cache.hits, Asteroid.frame_cache.misses
+        # Starting empty and keeping nothing, every spawn is a miss
+        Asteroid.frame_cache.clear()
+        Asteroid.frame_cache.capacity, capacity = 0, Asteroid.frame_cache.capacity
+        uncached_time = Benchmark.timeit(spawn)
+        uncached_hits, uncached_misses = Asteroid.frame_cache.hits, Asteroid.frame_cache.misses
+        Asteroid.frame_cache.capacity = capacity
+        Asteroid.frame_cache.clear()
+        assert uncached_hits == 0, "The uncached spawns were served from the cache"
+        print("Asteroid spawn, microseconds: cached %.1f (%d hits, %d misses), uncached %.1f (%d misses)" %
+              (cached_time, hits, misses, uncached_time, uncached_misses))
+
+    @staticmethod
+    def invaders():
+        """
+        Image memory of invader formations of growing size, which must stay the same
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        sizes = []
+        for formation_size in (1, 5, 30, 300):
+            formation = Formation(descend_speed=1, horizontal_speed=1, descend_steps=Const.INVADER_DESCEND)
+            invaders = [Invader(images=Resources.invader1, x=0, y=0, formation=formation)
+                        for _ in range(formation_size)]
+            surfaces = {id(image): image for invader in invaders for image in invader.images}
+            size = sum(image.get_bytesize() * image.get_width() * image.get_height() for image in surfaces.values())
+            sizes.append(size)
+            print("Formation of %3d invaders: %d distinct surfaces, %d bytes of pixels" %
+                  (formation_size, len(surfaces), size))
+        assert len(set(sizes)) == 1, "Invader images memory grows with the formation size"
+
+    @staticmethod
+    def rocket_atlas():
+        """
+        Rocket rotation atlas build time and size, and the launch time it saves
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        Rocket.build_atlas()
+        rotate_time = Benchmark.timeit(lambda: [Utils.rotate(image, 7.3) for image in Resources.rocket])
+        print("Rocket atlas: %d angles built in %.1f ms, %d bytes; rotating on launch took %.1f microseconds" %
+              (len(Rocket.atlas), Rocket.atlas_build_time * 1000, Rocket.atlas_bytes, rotate_time))
+
+    @staticmethod
+    def load_all(backends):
+        """
+        Return the time it takes to decode all frame sets with the given backends, in milliseconds
+        """
+        Resources.backends[:] = backends
+        start = clock()
+        for name in Resources.manifest:
+            Resources.frames(name)
+        Resources.backends[:] = []
+        return (clock() - start) * 1000
+
+    @staticmethod
+    def startup():
+        """
+        Time to load all frame sets from the separate files, the packed sprite sheets and the bundle.
+        The first pass is the cold start, the second one finds the files in the system's cache.
+        Then the blit time of the RLE frame sets from the files and the sheets, which must be RLE encoded either way.
+        """
+        window = pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        sources = [("files", lambda: []),
+                   ("sprite sheets", lambda: [SpriteSheet()]),
+                   ("bundle", lambda: [Bundle()])]
+        for source, backends in sources:
+            if all(backend.available() for backend in backends()):
+                cold = Benchmark.load_all(backends())
+                warm = Benchmark.load_all(backends())
+                print("Loading all frames from %s: cold %.1f ms, warm %.1f ms" % (source, cold, warm))
+            else:
+                print("No up to date %s, see the README on how to build them" % source)
+        sheet = SpriteSheet()
+        if not sheet.available():
+            return
+        for name, mode in Resources.formats.items():
+            if mode == Resources.RLE:
+                from_files = [Resources.prepare(pygame.image.load(path), mode) for path in Resources.manifest[name]]
+                from_sheet = sheet.frames(Resources.manifest[name], mode)
+                files_time = Benchmark.timeit(lambda: [window.blit(image, (10, 10)) for image in from_files])
+                sheet_time = Benchmark.timeit(lambda: [window.blit(image, (10, 10)) for image in from_sheet])
+                # The frames are RLE encoded on their first blit
+                assert all(image.get_flags() & pygame.RLEACCEL for image in from_sheet), "%s isn't RLE encoded" % name
+                print("%-16s blit per frame, microseconds: from files %6.2f, from sheets %6.2f" %
+                      (name, files_time / len(from_files), sheet_time / len(from_sheet)))
+
+    @staticmethod
+    def preload():
+        """
+        Time by which each group of assets is ready, decoded by a single thread versus a pool of them
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        groups = list(Resources.groups)
+        for workers in (1, 2, 4, 8):
+            for name in Resources.manifest:
+                if Resources.is_loaded(name):
+                    delattr(Resources, name)
+            Resources.preload(groups, workers=workers)
+            print("%d workers: " % workers +
+                  ", ".join("%s ready after %.1f ms" % (group, Resources.timings[group] * 1000) for group in groups))
+
+    class Box:
+        """
+        A stand-in for a hittable object
+        """
+        def __init__(self, hitbox):
+            self.hitbox = hitbox
+
+    @staticmethod
+    def random_boxes(count, seed=1):
+        """
+        Return objects with random hitboxes of enemy sizes spread over the screen
+        """
+        random = Random(seed)
+        return [Benchmark.Box((random.uniform(0, Const.SCREEN_WIDTH), random.uniform(0, Const.SCREEN_HEIGHT),
+                               random.uniform(10, 70), random.uniform(10, 70))) for _ in range(count)]
+
+    @staticmethod
+    def collisions():
+        """
+        Time to find everything every object hits with each collision backend, which must all agree.
+        Also the time of a tick's spaceship and rockets query, which the array backend does in one go.
+        """
+        backends = [Collision.PAIRS, Collision.GRID, Collision.ARRAYS]
+        print("All hits of every object, and a query of 3 boxes, microseconds per object")
+        for count in (3, 10, 30, 100, 300, 1000):
+            objects = Benchmark.random_boxes(count)
+            repeat = max(1, 3000 // count)
+            results = []
+            line = "%5d objects:" % count
+            for backend in backends:
+                index = Collision.index(backend)
+
+                def all_hits():
+                    index.rebuild(objects)
+                    return [index.query(obj.hitbox) for obj in objects]
+
+                def tick():
+                    index.rebuild(objects)
+                    return index.query_all([obj.hitbox for obj in objects[:3]])
+
+                results.append([set(map(id, hits)) for hits in all_hits()])
+                line += "  %s %8.2f / %8.2f" % (type(index).__name__, Benchmark.timeit(all_hits, repeat) / count,
+                                                Benchmark.timeit(tick, repeat) / count)
+            assert all(result == results[0] for result in results), "Collision backends disagree"
+            print(line)
+
+    @staticmethod
+    def allocated(function, repeat=100):
+        """
+        Return the bytes a function allocates temporarily, on average per run
+        """
+        tracemalloc.start()
+        total = 0
+        for _ in range(repeat):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            function()
+            total += tracemalloc.get_traced_memory()[1] - current
+        tracemalloc.stop()
+        return total / repeat
+
+    class TupleAsteroid(Asteroid):
+        """
+        An asteroid building a new hitbox tuple on every move, the way it was first done
+        """
+
+        def move(self):
+            if self.hitsize[2] != 0:
+                self.hitbox = tuple(map(sum, zip((self.x, self.y, -self.hitsize[0], -self.hitsize[1]), self.hitsize)))
+
+    class RectProjectile(Projectile):
+        """
+        A projectile building a new hitbox Rect on every move, the way it was first done
+        """
+
+        def update_hitbox(self):
+            self.hitbox = pygame.Rect(self.x, self.y, self.width, self.height)
+
+    @staticmethod
+    def allocations():
+        """
+        Memory allocated per tick by moving enemies and testing them against a box, per entity,
+        with the persistent hitboxes versus new ones on every move
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        allocated = []
+        for asteroid_type, projectile_type in ((Asteroid, Projectile),
+                                               (Benchmark.TupleAsteroid, Benchmark.RectProjectile)):
+            random = Random(1)
+            motion = Motion()
+            entities = [asteroid_type(images=Resources.asteroid1,
+                                      speed=(random.uniform(-1, 1), random.uniform(1, 5)), acceleration=(0, 0),
+                                      x=random.uniform(0, Const.SCREEN_WIDTH), y=0, motion=motion)
+                        for _ in range(100)]
+            entities += [projectile_type(random.uniform(0, Const.SCREEN_WIDTH), 0, motion) for _ in range(100)]
+            box = pygame.Rect(300, 300, 100, 100)
+
+            def tick():
+                motion.advance()
+                for entity in entities:
+                    entity.move()
+                box.collidelistall([entity.hitbox for entity in entities])
+
+            allocated.append(Benchmark.allocated(tick) / len(entities))
+        print("Moving and hit testing allocates %.1f bytes per entity and tick, %.1f with new hitboxes" %
+              tuple(allocated))
+        assert allocated[0] < allocated[1], "The persistent hitboxes don't allocate less"
+
+    @staticmethod
+    def masks():
+        """
+        Precise collision cost at level 10 densities: the whole formation and a field of asteroids,
+        every enemy tested against all others, with the masks only used after the hitboxes overlap
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        Rng.start(1)
+        placement = Random(1)
+        motion = Motion()
+        formation = Formation(descend_speed=1, horizontal_speed=1, descend_steps=Const.INVADER_DESCEND)
+        enemies = [Invader(images=Resources.invader1, x=40 + 120 * column, y=30 + 84 * line, formation=formation)
+                   for line in range(5) for column in range(6)]
+        enemies += [Asteroid(images=Resources.asteroid1, speed=(placement.uniform(-1.5, 1.5), placement.uniform(1, 5)),
+                             acceleration=(0, 0), x=placement.uniform(0, Const.SCREEN_WIDTH),
+                             y=placement.uniform(0, Const.SCREEN_HEIGHT), motion=motion) for _ in range(30)]
+        index = Collision.index()
+        ticks = 100
+        precise, Const.PRECISE_COLLISION = Const.PRECISE_COLLISION, True
+        Collision.mask_tests = Collision.mask_hits = 0
+        pairs = 0
+        start = clock()
+        for _ in range(ticks):
+            motion.advance()
+            formation.move()
+            for enemy in enemies:
+                enemy.move()
+            index.rebuild(enemies)
+            for enemy in enemies:
+                for other in index.query(enemy.hitbox):
+                    if other is not enemy:
+                        pairs += 1
+                        Collision.precise(enemy, other)
+        elapsed = (clock() - start) / ticks
+        Const.PRECISE_COLLISION = precise
+        print("%d enemies: %.1f hitbox overlaps, %.1f mask tests and %.1f mask hits per tick, "
+              "%.2f ms per tick (%.0f%% of a 60 Hz frame)" %
+              (len(enemies), pairs / ticks, Collision.mask_tests / ticks, Collision.mask_hits / ticks,
+               elapsed * 1000, elapsed * 60 * 100))
+
+    class Game:
+        """
+        A stand-in for the gameplay, recording every score added, by tick and enemy
+        """
+        def __init__(self):
+            self.tick = 0
+            self.spawned = []
+            self.scores = []
+
+        def add_score(self, enemy):
+            self.scores.append((self.tick, self.spawned.index(enemy), enemy.get_score()))
+
+    class FullScan(Enemies):
+        """
+        Enemies whose blasts are tested against all other enemies on every tick, the way it was first done
+        """
+        def detonate(self, enemy, order):
+            for other_enemy in self.get_enemies():
+                if not other_enemy.is_hit() and enemy.hitbox.colliderect(other_enemy.hitbox):
+                    other_enemy.hit()
+                    self.game.add_score(other_enemy)
+
+    class SteppedAsteroid(Asteroid):
+        """
+        An asteroid moved by adding its speed, and checked for leaving the screen, by every tick
+        """
+        __slots__ = ()
+        x = Interstellar.x
+        y = Interstellar.y
+
+        def departure(self):
+            return None
+
+        def step(self):
+            if not self.away:
+                self.x += self.speed[0]
+                self.y += self.speed[1]
+                if self.off_the_screen():
+                    self.away = True
+
+    class PolledAsteroid(Asteroid):
+        """
+        An asteroid which checks the clock whenever its picture is asked for, and turns it once its frame time is up,
+        the way it was first done
+        """
+        __slots__ = ()
+
+        def get_current_pic(self):
+            if SimClock.now() > self.next_frame:
+                self.frame_num += int(copysign(1, self.speed[0] + self.acceleration[0]))
+                if self.frame_num >= self.num_of_images:
+                    self.frame_num = 0
+                elif self.frame_num < 0:
+                    self.frame_num = self.num_of_images - 1
+                self.next_frame = SimClock.now() + self.frame_time
+            return self.current_image_set[self.frame_num]
+
+    class SteppedProjectile(Projectile):
+        """
+        A projectile moved down by its speed, and checked for leaving the screen, by every tick
+        """
+        __slots__ = ()
+        y = property(lambda projectile: projectile.origin_y)
+
+        def departure(self):
+            return None
+
+        def step(self):
+            if not self.exploding:
+                self.origin_y += self.speed
+                if self.y > Const.SCREEN_HEIGHT:
+                    self.away = True
+
+    class Stepwise(Enemies):
+        """
+        Enemies whose asteroids and projectiles are all stepped at the start of every tick, the way it was first done
+        """
+        def __init__(self, game):
+            super().__init__(game)
+            self.asteroid_type, self.projectile_type = Benchmark.SteppedAsteroid, Benchmark.SteppedProjectile
+
+        def move(self):
+            for entity in self.asteroids + self.projectiles:
+                entity.step()
+            super().move()
+
+    @staticmethod
+    def cascade(enemies_class, count, ticks=300, seed=1):
+        """
+        Play a seeded dense asteroid field, in which an asteroid is shot every few ticks.
+        The asteroids are placed at whole pixels, as they appear in the game, see Motion.
+        Return the scores added by the chain explosions, where all enemies ended up and the time per tick in ms.
+        """
+        Rng.start(seed)
+        shots = Random(seed)
+        game = Benchmark.Game()
+        enemies = enemies_class(game)
+        for _ in range(count):
+            enemies.add_asteroid()
+        for asteroid in enemies.asteroids:
+            asteroid.set_xy(shots.randrange(Const.SCREEN_WIDTH), shots.randrange(Const.SCREEN_HEIGHT))
+        game.spawned = enemies.get_enemies()
+        start = clock()
+        for game.tick in range(ticks):
+            if game.tick % 20 == 0 and enemies.asteroids:
+                enemies.hit(enemies.asteroids[shots.randrange(len(enemies.asteroids))])
+            enemies.move()
+        elapsed = (clock() - start) / ticks * 1000
+        states = [(enemy.get_xy(), tuple(enemy.hitbox), enemy.is_hit(), enemy.is_away()) for enemy in game.spawned]
+        return game.scores, states, elapsed
+
+    @staticmethod
+    def chain():
+        """
+        Chain explosions in dense asteroid fields, resolved by events versus scanning every enemy on every tick.
+        Both must blow up the same asteroids on the same ticks, in the same order, and leave them at the same places.
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        for count in (30, 100, 300):
+            scores, states, events_time = Benchmark.cascade(Enemies, count)
+            expected, expected_states, scan_time = Benchmark.cascade(Benchmark.FullScan, count)
+            assert scores == expected and states == expected_states, "Chain explosions differ from the full scan"
+            print("%3d asteroids: %3d blown up by others, %.2f ms per tick with events, %.2f ms scanning" %
+                  (count, len(scores), events_time, scan_time))
+
+    class Plain:
+        """
+        An object keeping its attributes in a __dict__, the way the entities did before they had __slots__
+        """
+
+    @staticmethod
+    def plain(obj):
+        """
+        Return a Plain object with the same attributes as the given entity, the ones kept by properties included
+        """
+        plain = Benchmark.Plain()
+        for cls in type(obj).__mro__:
+            names = list(getattr(cls, "__slots__", ()))
+            names += [name for name, value in vars(cls).items() if isinstance(value, property)]
+            for name in names:
+                try:
+                    setattr(plain, name, getattr(obj, name))
+                except (AttributeError, TypeError):
+                    pass  # A slot not set, or a property not worked out for this entity
+        plain.__dict__.update(getattr(obj, "__dict__", {}))
+        return plain
+
+    @staticmethod
+    def size(obj):
+        """
+        Return the bytes taken by an object and its __dict__, not counting the objects its attributes refer to
+        """
+        return sys.getsizeof(obj) + (sys.getsizeof(obj.__dict__) if hasattr(obj, "__dict__") else 0)
+
+    @staticmethod
+    def slots():
+        """
+        Bytes per entity and attribute read time of the slotted entities, versus the same attributes in a __dict__
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        spaceship = Spaceship(x=Const.INITIAL_X_POS, y=Const.INITIAL_Y_POS, screen=None)
+        entities = [Asteroid(images=Resources.asteroid1, speed=(0, 1), acceleration=(0, 0)),
+                    Invader(images=Resources.invader1, x=0, y=0,
+                            formation=Formation(descend_speed=1, horizontal_speed=1, descend_steps=20)),
+                    Projectile(0, 0),
+                    Rocket(spaceship=spaceship, side=None),
+                    Star(images=Resources.star_small, speed=(0, 1), x=0, y=0),
+                    spaceship]
+        Spaceship.reset()
+        print("Bytes per entity and time to read its position 1000 times, microseconds")
+        for entity in entities:
+            plain = Benchmark.plain(entity)
+            times = [Benchmark.timeit(lambda: [(item.x, item.y) for _ in range(1000)], repeat=100)
+                     for item in (entity, plain)]
+            print("%-10s slots %4d bytes %8.1f, dict %4d bytes %8.1f" %
+                  (type(entity).__name__, Benchmark.size(entity), times[0], Benchmark.size(plain), times[1]))
+
+    @staticmethod
+    def removal():
+        """
+        Time to take the projectiles that left the screen out of the list, one by one versus in a single pass,
+        with half of them leaving on the same tick
+        """
+        print("Removing half of the projectiles, milliseconds")
+        for count in (100, 1000, 3000, 10000):
+            projectiles = [Projectile(number, 0) for number in range(count)]
+            for projectile in projectiles[::2]:
+                projectile.away = True
+
+            def one_by_one():
+                items = list(projectiles)
+                for item in [item for item in items if item.is_away()]:
+                    items.remove(item)
+                return items
+
+            def single_pass():
+                items = list(projectiles)
+                Enemies.compact(items)
+                return items
+
+            assert one_by_one() == single_pass(), "The projectiles left are not the same"
+            repeat = max(1, 10000 // count)
+            print("%5d projectiles: one by one %8.3f, single pass %8.3f" %
+                  (count, Benchmark.timeit(one_by_one, repeat) / 1000, Benchmark.timeit(single_pass, repeat) / 1000))
+
+    @staticmethod
+    def motion():
+        """
+        Tick time with the asteroids and projectiles moved by their Motion, versus stepped and checked for leaving
+        the screen by every tick. Both must have them at the same places on every tick, and blow up the same ones.
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        ticks = 600
+        for count in (100, 300, 1000):
+            results = []
+            for enemies_class in (Enemies, Benchmark.Stepwise):
+                Rng.start(1)
+                shots = Random(1)
+                game = Benchmark.Game()
+                enemies = enemies_class(game)
+                for number in range(30):
+                    enemies.add_invader(x=40 + 120 * (number % 6), y=30 + 84 * (number // 6), speed=1)
+                enemies.invaders_arrived()
+                game.spawned = list(enemies.invaders)
+                places = []
+                elapsed = 0
+                for game.tick in range(ticks):
+                    # The field is kept full, and its projectiles as many, as they leave the screen
+                    while len(enemies.asteroids) < count:
+                        enemies.add_asteroid()
+                        game.spawned.append(enemies.asteroids[-1])
+                    for _ in range(count - len(enemies.projectiles)):
+                        enemies.invader_shoot()
+                    if game.tick % 20 == 0:
+                        enemies.hit(enemies.asteroids[shots.randrange(len(enemies.asteroids))])
+                    start = clock()
+                    enemies.move()
+                    elapsed += clock() - start
+                    places.append([(entity.get_xy(), tuple(entity.hitbox), entity.is_away())
+                                   for entity in enemies.asteroids + enemies.projectiles])
+                results.append((places, game.scores, elapsed / ticks * 1000))
+            (places, scores, motion_time), (stepped_places, stepped_scores, stepped_time) = results
+            assert places == stepped_places, "The motion differs from stepping"
+            assert scores == stepped_scores, "The chain explosions differ from stepping"
+            print("%4d asteroids and projectiles each: %d blown up by others, %.2f ms per tick with motion, "
+                  "%.2f ms stepping" % (count, len(scores), motion_time, stepped_time))
+
+    @staticmethod
+    def interpolation():
+        """
+        Time to draw a frame of a busy level, with the objects drawn between their last two ticks and without
+        """
+        Rng.start(1)
+        game = Benchmark.Game()
+        game.screen = Screen()
+        enemies = Enemies(game)
+        for number in range(30):
+            enemies.add_invader(x=40 + 120 * (number % 6), y=30 + 84 * (number // 6), speed=1)
+        enemies.invaders_arrived()
+        for _ in range(30):
+            enemies.add_asteroid()
+            enemies.invader_shoot()
+            game.screen.move()
+            enemies.move()
+            SimClock.advance()
+        spaceship = Spaceship(x=Const.INITIAL_X_POS, y=Const.INITIAL_Y_POS, screen=game.screen)
+        rockets = [Rocket(spaceship=spaceship, side=side) for side in (Direction.left, Direction.right)]
+        spaceship.set_direction(Direction.right)
+        for entity in [spaceship] + rockets:
+            entity.move()
+        Spaceship.reset()
+
+        def frame():
+            game.screen.draw()
+            enemies.draw()
+            spaceship.draw()
+            for rocket in rockets:
+                rocket.draw()
+
+        alpha = SimClock.alpha
+        times = []
+        for SimClock.alpha in (1.0, 0.5):
+            times.append(Benchmark.timeit(frame, repeat=200) / 1000)
+        SimClock.alpha = alpha
+        print("%d enemies, %d projectiles: %.3f ms per frame as ticked, %.3f ms interpolated (%+.1f%%)" %
+              (len(enemies.get_enemies()), len(enemies.projectiles), times[0], times[1],
+               (times[1] / times[0] - 1) * 100))
+
+    @staticmethod
+    def animation():
+        """
+        Time per tick to animate a formation and a field of asteroids and to get all their pictures,
+        with the asteroids spinning by the ticks, versus every asteroid checking the clock as it did before
+        """
+        pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        ticks = 300
+        for count in (30, 300, 3000):
+            times = []
+            for asteroid_type in (Asteroid, Benchmark.PolledAsteroid):
+                Rng.start(1)
+                Animation.clear()
+                Animation.done = SimClock.ticks
+                enemies = Enemies(Benchmark.Game())
+                enemies.asteroid_type = asteroid_type
+                for number in range(30):
+                    enemies.add_invader(x=40 + 120 * (number % 6), y=30 + 84 * (number // 6), speed=1)
+                for _ in range(count):
+                    enemies.add_asteroid()
+                sprites = enemies.get_enemies()
+                start = clock()
+                for _ in range(ticks):
+                    SimClock.advance()
+                    Animation.advance()
+                    for sprite in sprites:
+                        sprite.get_current_pic()
+                times.append((clock() - start) / ticks * 1000)
+            print("%4d asteroids and 30 invaders: %.3f ms per tick spinning by the ticks, %.3f ms polling the clock" %
+                  (count, times[0], times[1]))
+        Animation.clear()
+
+
+if __name__ == '__main__':
+    pygame.init()
+    for benchmark in sys.argv[1:] or Benchmark.all:
+        getattr(Benchmark, benchmark)()
@@ -0,0 +1,39 @@
+import pygame
+
+
+class Bot:
+    """
+    A player for running the game without anyone at the keyboard. It steers the spaceship under the lowest
+    enemy which isn't hit yet, and launches a rocket whenever that one is straight above.
+    It plays by key events, the same ones a person playing makes.
+    """
+
+    AIM = 20  # How far from the middle of the spaceship the target still counts as straight above, in pixels
+
+    def __init__(self):
+        self.key = None  # The arrow key held down
+
+    def events(self, game):
+        """
+        Return the key events for the next tick of the game
+        """
+        events = []
+        targets = [enemy for enemy in game.enemies.get_enemies() if not enemy.is_hit() and enemy.get_xy()[1] > 0]
+        ship = game.spaceship.hitbox.centerx
+        key = None
+        if targets:
+            target = max(targets, key=lambda enemy: enemy.get_xy()[1]).hitbox.centerx
+            if target < ship - Bot.AIM:
+                key = pygame.K_LEFT
+            elif target > ship + Bot.AIM:
+                key = pygame.K_RIGHT
+            else:
+                rocket = pygame.K_z if not game.rocket_left.is_launched() else pygame.K_x
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=rocket))
+        if key != self.key:
+            if self.key is not None:
+                events.append(pygame.event.Event(pygame.KEYUP, key=self.key))
+            if key is not None:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+            self.key = key
+        return events
@@ -0,0 +1,116 @@
+import numpy
+
+
+class BoxArray:
+    """
+    The hitboxes of a group of objects kept in one contiguous array, so that testing a box against
+    all of them is a few whole-array operations instead of a pygame.Rect test per object.
+    The test is the same as pygame.Rect.colliderect: coordinates are truncated to integers the way
+    pygame.Rect does, boxes without an area never hit, and a negative size spans to the other side.
+    Objects must be moved in the array whenever their hitbox changes.
+    A generation counter tells whether any box changed since a query, see stamp().
+    """
+
+    def __init__(self):
+        self.objects = []
+        self.slots = {}
+        # Left, top, right and bottom of every box, and whether the slot takes part in the tests
+        self.bounds = numpy.zeros((0, 4), dtype=numpy.int64)
+        self.valid = numpy.zeros(0, dtype=bool)
+        self.generation = 0
+
+    @staticmethod
+    def to_bounds(boxes):
+        """
+        Convert hitboxes (x, y, width, height) to the left, top, right and bottom of pygame.Rects made of them,
+        together with whether each of them has an area
+        """
+        boxes = numpy.array(boxes, dtype=numpy.float64).reshape(-1, 4).astype(numpy.int64)
+        ends = boxes[:, :2] + boxes[:, 2:]
+        bounds = numpy.concatenate((numpy.minimum(boxes[:, :2], ends), numpy.maximum(boxes[:, :2], ends)), axis=1)
+        return bounds, (boxes[:, 2] != 0) & (boxes[:, 3] != 0)
+
+    def rebuild(self, objects):
+        """
+        Replace the contents with the given objects
+        """
+        self.objects = list(objects)
+        self.slots = {obj: slot for slot, obj in enumerate(self.objects)}
+        self.bounds, self.valid = self.to_bounds([tuple(obj.hitbox) for obj in self.objects])
+        self.generation += 1
+
+    def add(self, obj):
+        """
+        Add an object by its current hitbox
+        """
+        bounds, valid = self.to_bounds([tuple(obj.hitbox)])
+        self.slots[obj] = len(self.objects)
+        self.objects.append(obj)
+        self.bounds = numpy.concatenate((self.bounds, bounds))
+        self.valid = numpy.concatenate((self.valid, valid))
+        self.generation += 1
+
+    def remove(self, obj):
+        """
+        Remove an object, if it is in the array. Its slot is freed when most slots are free.
+        """
+        slot = self.slots.pop(obj, None)
+        if slot is not None:
+            self.valid[slot] = False
+            self.generation += 1
+            if len(self.slots) * 2 < len(self.objects):
+                self.compact()
+
+    def compact(self):
+        """
+        Drop the slots of removed objects, keeping the others in order
+        """
+        kept = sorted(self.slots.values())
+        self.objects = [self.objects[slot] for slot in kept]
+        self.slots = {obj: slot for slot, obj in enumerate(self.objects)}
+        self.bounds = self.bounds[kept]
+        self.valid = self.valid[kept]
+
+    def move(self, obj):
+        """
+        Update the box of an object after its hitbox has changed
+        """
+        if obj not in self.slots:
+            self.add(obj)
+            return
+        slot = self.slots[obj]
+        bounds, valid = self.to_bounds([tuple(obj.hitbox)])
+        if (self.bounds[slot] != bounds[0]).any() or self.valid[slot] != valid[0]:
+            self.bounds[slot] = bounds[0]
+            self.valid[slot] = valid[0]
+            self.generation += 1
+
+    def stamp(self, box):
+        """
+        Return what a query of the box depends on, which here is every box
+        """
+        return self.generation
+
+    def overlaps(self, boxes):
+        """
+        Return the overlap matrix of the given boxes against all the objects
+        """
+        bounds, valid = self.to_bounds(boxes)
+        return ((bounds[:, None, 0] < self.bounds[None, :, 2]) & (bounds[:, None, 2] > self.bounds[None, :, 0]) &
+                (bounds[:, None, 1] < self.bounds[None, :, 3]) & (bounds[:, None, 3] > self.bounds[None, :, 1]) &
+                valid[:, None] & self.valid[None, :])
+
+    def query(self, box):
+        """
+        Return the objects whose hitbox overlaps the box, in the order they were added
+        """
+        return [self.objects[slot] for slot in numpy.flatnonzero(self.overlaps([tuple(box)])[0])]
+
+    def query_all(self, boxes):
+        """
+        Return the objects each of the boxes overlaps, computed all at once
+        """
+        if not boxes:
+            return []
+        matrix = self.overlaps([tuple(box) for box in boxes])
+        return [[self.objects[slot] for slot in numpy.flatnonzero(row)] for row in matrix]
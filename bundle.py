@@ -0,0 +1,126 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import pygame
+from resources import Resources
+
+
+class Bundle:
+    """
+    All the frames of the game decoded in advance into a single file of raw RGBA pixels.
+    The file is memory mapped, and the surfaces are created right over the mapped pixels,
+    so starting the game needs neither PNG decompression nor reading more than it uses.
+    The bundle is built by running "python bundle.py". It stores the size and the modification time
+    of the files it was built from, and is not used if any of them has changed since.
+
+    File layout: the magic, the header length, a JSON header, and the pixel blocks each aligned to 16 bytes.
+    """
+
+    PATH = "res/assets.bundle"
+    MAGIC = b"SPGB"
+    ALIGN = 16
+
+    def __init__(self, path=PATH):
+        self.path = path
+        self.header = None
+        self.map = None
+        self.lock = threading.Lock()  # Frame sets may be loaded by several threads at once
+
+    @staticmethod
+    def stamp(path):
+        """
+        Return the size and the modification time of a source file, which tell if it has changed
+        without reading it
+        """
+        status = os.stat(path)
+        return [status.st_size, status.st_mtime_ns]
+
+    def available(self):
+        """
+        Return true if the bundle exists and was built from the current source files
+        """
+        if self.header is None:
+            self.header = {"frames": {}}
+            if not os.path.exists(self.path):
+                return False
+            with open(self.path, "rb") as bundle_file:
+                bundle_map = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, header_length = struct.unpack_from("<4sI", bundle_map)
+            if magic != Bundle.MAGIC:
+                return False
+            header = json.loads(bytes(bundle_map[8:8 + header_length]).decode())
+            for path, stamp in header["sources"].items():
+                if not os.path.exists(path) or Bundle.stamp(path) != stamp:
+                    return False
+            self.header = header
+            self.map = bundle_map
+        return bool(self.header["frames"])
+
+    def covers(self, paths):
+        """
+        Return true if all the given files are bundled
+        """
+        with self.lock:
+            return self.available() and all(path in self.header["frames"] for path in paths)
+
+    def frames(self, paths, mode):
+        """
+        Return surfaces over the bundled pixels of the given files, or None if they aren't all bundled
+        """
+        if not self.covers(paths):
+            return None
+        frames = []
+        for path in paths:
+            offset, width, height = self.header["frames"][path]
+            pixels = memoryview(self.map)[offset:offset + width * height * 4]
+            # No copy is made here, the one made by converting for the display is the only one
+            frames.append(Resources.prepare(pygame.image.frombuffer(pixels, (width, height), "RGBA"), mode))
+        return frames
+
+    @staticmethod
+    def build(path=PATH):
+        """
+        Decode all frame sets of Resources and write them into a bundle
+        """
+        to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+        header = {"sources": {}, "frames": {}}
+        blocks = []
+        offset = 0
+        for paths in Resources.manifest.values():
+            for source in paths:
+                if source in header["sources"]:
+                    continue
+                image = pygame.image.load(source)
+                pixels = to_bytes(image, "RGBA")
+                padding = -len(pixels) % Bundle.ALIGN
+                header["sources"][source] = Bundle.stamp(source)
+                header["frames"][source] = [offset, image.get_width(), image.get_height()]
+                blocks.append(pixels + bytes(padding))
+                offset += len(pixels) + padding
+        # The offsets in the header are from the start of the file, so they depend on the header length itself:
+        # encode it until it fits the space it was given, then pad it so the pixels start aligned
+        header_length = 0
+        while True:
+            start = 8 + header_length
+            start += -start % Bundle.ALIGN
+            encoded = json.dumps({"sources": header["sources"],
+                                  "frames": {source: [start + frame[0], frame[1], frame[2]]
+                                             for source, frame in header["frames"].items()}}).encode()
+            if len(encoded) <= header_length:
+                break
+            header_length = len(encoded)
+        encoded = encoded.ljust(start - 8)
+        with open(path, "wb") as bundle_file:
+            bundle_file.write(struct.pack("<4sI", Bundle.MAGIC, len(encoded)))
+            bundle_file.write(encoded)
+            for block in blocks:
+                bundle_file.write(block)
+        return header
+
+
+if __name__ == '__main__':
+    pygame.init()
+    built = Bundle.build()
+    print("Bundled %d frames into %s" % (len(built["frames"]), Bundle.PATH))
@@ -0,0 +1,126 @@
+import pygame
+from const import Const
+from spatial_hash import SpatialHash
+try:
+    from box_array import BoxArray
+except ImportError:
+    # NumPy is optional, without it the other backends are used
+    BoxArray = None
+
+
+class Collision:
+    """
+    The plain collision backend: a query tests the box against the hitboxes of all objects with collidelistall().
+    This works on the objects' own pygame.Rects, which they update in place, so nothing is rebuilt when they move.
+    A generation counter tells whether any hitbox changed since a query, see stamp().
+    The other backends answer the same queries with the same results, see Collision.index().
+    """
+
+    PAIRS = "pairs"
+    GRID = "grid"
+    ARRAYS = "arrays"
+
+    # Pairs whose hitboxes overlap that went on to be tested by their masks, and how many of them did touch
+    mask_tests = 0
+    mask_hits = 0
+    # Solid masks for objects without one, by size
+    solid_masks = {}
+
+    @staticmethod
+    def precise(obj, other):
+        """
+        In the precise collision mode, tell whether two objects whose hitboxes overlap really touch,
+        by their masks. Without the mode, or for two solid objects, the hitboxes are what counts.
+        """
+        if not Const.PRECISE_COLLISION:
+            return True
+        masks = [obj.get_mask(), other.get_mask()]
+        if masks[0] is None and masks[1] is None:
+            return True
+        Collision.mask_tests += 1
+        for number, (item, item_mask) in enumerate(zip((obj, other), masks)):
+            if item_mask is None:
+                size = item.hitbox.size
+                if size not in Collision.solid_masks:
+                    Collision.solid_masks[size] = pygame.mask.Mask(size, fill=True)
+                masks[number] = Collision.solid_masks[size], item.hitbox.topleft
+        (mask, (x, y)), (other_mask, (other_x, other_y)) = masks
+        if mask.overlap(other_mask, (other_x - x, other_y - y)) is None:
+            return False
+        Collision.mask_hits += 1
+        return True
+
+    @staticmethod
+    def index(backend=None):
+        """
+        Return an empty collision index of the given backend, by default the one set in Const
+        """
+        backend = backend or Const.COLLISION_BACKEND
+        if backend == Collision.ARRAYS and BoxArray is not None:
+            return BoxArray()
+        if backend == Collision.PAIRS:
+            return Collision()
+        return SpatialHash()
+
+    def __init__(self):
+        self.objects = []
+        self.rects = []
+        self.boxes = {}
+        self.generation = 0
+
+    def rebuild(self, objects):
+        """
+        Replace the contents with the given objects
+        """
+        self.objects = list(objects)
+        self.rects = [obj.hitbox for obj in self.objects]
+        self.boxes = {obj: tuple(obj.hitbox) for obj in self.objects}
+        self.generation += 1
+
+    def add(self, obj):
+        """
+        Add an object
+        """
+        self.objects.append(obj)
+        self.rects.append(obj.hitbox)
+        self.boxes[obj] = tuple(obj.hitbox)
+        self.generation += 1
+
+    def remove(self, obj):
+        """
+        Remove an object, if it is there
+        """
+        if obj in self.objects:
+            index = self.objects.index(obj)
+            del self.objects[index]
+            del self.rects[index]
+            del self.boxes[obj]
+            self.generation += 1
+
+    def move(self, obj):
+        """
+        Only note whether the hitbox changed, the hitboxes themselves are read when queried
+        """
+        box = tuple(obj.hitbox)
+        if self.boxes.get(obj) != box:
+            self.boxes[obj] = box
+            self.generation += 1
+
+    def stamp(self, box):
+        """
+        Return what a query of the box depends on, which here is everything
+        """
+        return self.generation
+
+    def query(self, box):
+        """
+        Return the objects whose hitbox overlaps the box
+        """
+        rect = box if isinstance(box, pygame.Rect) else pygame.Rect(box)
+        return [self.objects[index] for index in rect.collidelistall(self.rects)]
+
+    def query_all(self, boxes):
+        """
+        Return the objects each of the boxes overlaps
+        """
+        return [self.query(box) for box in boxes]
@@ -15,6 +15,13 @@ class Const:
     SPACESHIP_SPEED_DROP_ON_SIDE_IMPACT = 1.5
     SPACESHIP_HITSIZE = (7, 15, -7, -15)
 
+    TICK_RATE = 60  # Ticks of the game logic per second, however many frames are drawn
+    MAX_CATCH_UP_TICKS = 5  # Most ticks run before drawing a frame, a slower machine slows the game down instead
+    FRAME_RATE = 0  # Most frames drawn per second, 0 draws as many as the machine can
+    ANIMATION_WHEEL_SIZE = 64  # Slots of the animation timer wheel, one per tick, see Animation
+    RECORDING = "last_game.txt"  # File the key events of the last game are saved to for replays, None saves none
+    INTERPOLATION = True  # Draw the moving objects between their last two ticks, for frames drawn more often
+
     FRAME_TIME_SEC = 0.1
     NOTIFICATION_TIME = 3
     BLINKING_PERIOD = 3
@@ -27,6 +34,8 @@ class Const:
     ROCKET_STOWED_OFFSET_Y = 32
     ROCKET_FLAME_SIZE = 12
     ROCKET_HORIZONTAL_SPEED_DELTA = 6  # The lower - the closer the rocket horizontal speed to the spaceship's one
+    ROCKET_ANGLE_RATIO = 3  # Launch angle in degrees per unit of the rocket's horizontal speed
+    ROCKET_ANGLE_STEP = 0.5  # Launch angles are rounded to this step, every step has its rotated images prepared
 
     STAR_NUM_SMALL = 60
     STAR_NUM_BRIGHT = 20
@@ -58,10 +67,19 @@ class Const:
     ASTEROID_APPEAR_HEIGHT = -150
     ASTEROID_ANIMATE_COEFFICIENT = 7  # Asteroid's rotation speed is determined by its vertical speed
     ASTEROID_HITSIZE_COEFFICIENT = 9
+    ASTEROID_SIZE_BUCKET = 2  # Asteroid sizes are rounded to this granularity, so that their frames can be shared
+    ASTEROID_CACHE_SIZE = 16  # How many asteroid sizes are kept scaled
 
     EXPLOSION_ANIMATE_SPEED = 0.05
     EXPLOSION_HIT_DELTA = 65
 
+    # "pairs" tests every pair, "grid" uses a spatial hash, "arrays" uses NumPy. The grid only gets faster
+    # than the pairs from about 100 objects, the arrays from about 300, and a level has fewer than 100 enemies
+    COLLISION_BACKEND = "pairs"
+    SPATIAL_HASH_CELL_SIZE = 80  # About an invader, so a hitbox covers few cells and a cell holds few objects
+    PRECISE_COLLISION = False  # Test the pixels of the sprites whose hitboxes overlap
+    MOTION_RESOLUTION = 1024  # Asteroid speeds are multiples of its inverse, a power of 2 so motion is exact
+
     INITIAL_X_POS = SCREEN_WIDTH / 2
     INITIAL_Y_POS = SCREEN_HEIGHT - SCREEN_HEIGHT / 10
 
@@ -80,6 +98,12 @@ class Const:
     PLAYER_LIVES_POSITION = (10, 10)
     PLAYER_SCORE_POSITION = (10, 40)
 
+    FONT_SIZE_TITLE = 48
+    FONT_SIZE_MENU = 32
+    FONT_SIZE_TEXT = 24
+    NOTIFICATION_SCALE = 4
+    TEXT_CACHE_SIZE = 64  # Rendered texts kept, the least recently drawn ones are rendered again when needed
+
     PROJECTILE_WIDTH = 8
     PROJECTILE_HEIGHT = 16
     PROJECTILE_SPEED = 3
@@ -1,10 +1,14 @@
 from asteroid import Asteroid
 from invader import Invader
 from projectile import Projectile
-from random import randint, uniform
+from rng import Rng
 from const import Const
 from resources import Resources
 from direction import Direction
+from collision import Collision
+from formation import Formation
+from motion import Motion
+from animation import Animation
 import pygame
 
 
@@ -22,62 +26,111 @@ class Enemies:
         self.asteroids = []
         self.invaders = []
         self.projectiles = []
+        self.enemies = None  # Both lists joined, until one of them changes
+        self.formation = None  # The invaders of the current level
+        self.motion = Motion()  # Moves the asteroids and the projectiles, and tells when they leave the screen
+        # The types the asteroids and the projectiles are made of, which the benchmarks replace with stand-ins
+        self.asteroid_type, self.projectile_type = Asteroid, Projectile
+        # Where the enemies and the projectiles are, for finding what was hit
+        self.grid = Collision.index()
+        self.projectiles_grid = Collision.index()
+        # The enemies not hit yet, which are all a blast can reach. Their hitboxes are tested against it all at once
+        # by pygame, see Collision, which is quicker than going through the grid cells of every blast on every tick.
+        self.targets = Collision()
+        # Exploding enemies, by the hitbox and targets stamp their blast was last resolved with, None until it is
+        self.detonations = {}
 
     def get_enemies(self):
         """
-        Return all enemies
+        Return all enemies, in a list which must not be modified
         """
-        return self.asteroids + self.invaders
+        if self.enemies is None:
+            self.enemies = self.asteroids + self.invaders
+        return self.enemies
 
     def add_asteroid(self):
         """
         Add a new asteroid with random values
         """
-        speed_vertical = uniform(Const.ASTEROID_SPEED_VERTICAL_MIN, Const.ASTEROID_SPEED_VERTICAL_MAX)
-        speed_horizontal = uniform(Const.ASTEROID_SPEED_HORIZONTAL_MIN, Const.ASTEROID_SPEED_HORIZONTAL_MAX)
+        uniform, randint = Rng.gameplay.uniform, Rng.gameplay.randint
+        speed_vertical = Motion.quantize(uniform(Const.ASTEROID_SPEED_VERTICAL_MIN, Const.ASTEROID_SPEED_VERTICAL_MAX))
+        speed_horizontal = Motion.quantize(uniform(Const.ASTEROID_SPEED_HORIZONTAL_MIN,
+                                                   Const.ASTEROID_SPEED_HORIZONTAL_MAX))
         acc_vertical = uniform(Const.ASTEROID_ACCELERATION_VERTICAL_MIN, Const.ASTEROID_ACCELERATION_VERTICAL_MAX)
         acc_horizontal = uniform(Const.ASTEROID_ACCELERATION_HORIZONTAL_MIN, Const.ASTEROID_ACCELERATION_HORIZONTAL_MAX)
         x = randint(Const.ASTEROID_BORDER_LEFT, Const.ASTEROID_BORDER_RIGHT)
         y = Const.ASTEROID_APPEAR_HEIGHT
-        asteroid = Asteroid(
+        asteroid = self.asteroid_type(
             images=Resources.asteroid1,
             speed=(speed_horizontal, speed_vertical),
             acceleration=(acc_horizontal, acc_vertical),
             x=x,
-            y=y
+            y=y,
+            motion=self.motion
         )
         self.asteroids.append(asteroid)
+        self.enemies = None
+        self.grid.add(asteroid)
+        self.targets.add(asteroid)
 
     def add_invader(self, x, y, speed):
         """
-        Add an invader to enemies, converting the provided parameters
+        Add an invader to enemies, converting the provided parameters.
+        The invaders added while there are none form a new formation.
         """
-        invader = Invader(images=Resources.invader1,
-                          x=x, y=y,
-                          descend_speed=speed,
-                          horizontal_speed=speed,
-                          descend_steps=20)
+        if not self.invaders:
+            self.formation = Formation(descend_speed=speed, horizontal_speed=speed, descend_steps=Const.INVADER_DESCEND)
+        invader = Invader(images=Resources.invader1, x=x, y=y, formation=self.formation)
         self.invaders.append(invader)
+        self.enemies = None
+        self.grid.add(invader)
+        self.targets.add(invader)
+
+    def hit(self, enemy):
+        """
+        Hit an enemy, and queue its blast to be resolved against its neighbours when it moves next
+        """
+        enemy.hit()
+        self.targets.remove(enemy)
+        self.detonations[enemy] = None
+
+    def detonate(self, enemy, order):
+        """
+        Resolve the blast of an exploding enemy, hitting every other enemy within its reach.
+        Once resolved, a blast only has to be resolved again after its hitbox, or any of the targets, has changed:
+        until then it reaches the same enemies, which it has already hit.
+        The masks change with every frame, so in the precise collision mode it is always resolved.
+        The enemies reached are hit in their order, which only has to be sorted out when there are several.
+        """
+        state = (tuple(enemy.hitbox), self.targets.stamp(enemy.hitbox))
+        if self.detonations.get(enemy) == state and not Const.PRECISE_COLLISION:
+            return
+        self.detonations[enemy] = state
+        reached = [other_enemy for other_enemy in self.targets.query(enemy.hitbox)
+                   if not other_enemy.is_hit() and Collision.precise(enemy, other_enemy)]
+        if len(reached) > 1:
+            reached.sort(key=order.get)
+        for other_enemy in reached:
+            self.hit(other_enemy)
+            self.game.add_score(other_enemy)
 
     def invaders_arrived(self):
         """
         The invaders have reached their nominal height
         """
-        if randint(0, 1) == 0:
+        if Rng.gameplay.randint(0, 1) == 0:
             direction = Direction.right
         else:
             direction = Direction.left
+        self.formation.arrived(direction)
         for invader in self.invaders:
-            invader.arrived(direction)
+            invader.arrived()
 
     def all_invaders_appeared(self):
         """
         Check if all invaders already appear on the screen
         """
-        for invader in self.invaders:
-            if invader.get_xy()[1] < Const.INVADER_TOP_BORDER:
-                return False
-        return True
+        return self.formation is None or self.formation.appeared()
 
     def current_number_of_invaders(self):
         """
@@ -98,67 +151,88 @@ class Enemies:
         # Only shoot if there are invaders that can shoot
         shooting_invaders = [inv for inv in self.invaders if inv.can_shoot and not inv.is_hit()]
         if shooting_invaders:
-            shooter = shooting_invaders[randint(0, len(shooting_invaders) - 1)]
+            shooter = shooting_invaders[Rng.gameplay.randint(0, len(shooting_invaders) - 1)]
             x, y = shooter.get_projectile_spawn_position()
-            self.projectiles.append(Projectile(x, y))
+            self.projectiles.append(self.projectile_type(x, y, self.motion))
+
+    @staticmethod
+    def compact(items):
+        """
+        Take the items that are away out of a list in a single pass, keeping the order of the others,
+        and return them
+        """
+        gone = []
+        kept = 0
+        for item in items:
+            if item.is_away():
+                gone.append(item)
+            else:
+                items[kept] = item
+                kept += 1
+        del items[kept:]
+        return gone
 
     def move(self):
         """
         Move all existing enemies
         """
         enemies = self.get_enemies()
-        to_remove = []
-        direction_swap_needed = False
-        # Move all the enemies
+        order = {enemy: number for number, enemy in enumerate(enemies)}
+        enemies_gone = False
+        # Move all the enemies. The formation moves all the invaders at once, and so does the motion with the
+        # asteroids and the projectiles. Each enemy then only moves its hitbox in its turn.
+        self.motion.advance()
+        if self.formation is not None:
+            self.formation.move()
         for enemy in enemies:
             enemy.move()
+            self.grid.move(enemy)
+            if not enemy.is_hit():
+                self.targets.move(enemy)
             # Check if the enemy is off the screen, it should be removed
             if enemy.is_away():
-                to_remove.append(enemy)
-            # Check if we need to change the direction of the invaders
-            if isinstance(enemy, Invader):
-                horizontal_location, _ = enemy.get_xy()
-                direction = enemy.get_horizontal_direction()
-                if horizontal_location >= Const.INVADER_RIGHT_BORDER and direction == Direction.right or \
-                        horizontal_location <= Const.INVADER_LEFT_BORDER and direction == Direction.left:
-                    direction_swap_needed = True
-            # This will blow up other enemies within reach
+                enemies_gone = True
+            # This will blow up other enemies within reach.
+            # The ones not moved yet are still in the grid by their previous hitboxes, as if all were tested here.
             if enemy.is_hit():
-                for other_enemy in enemies:
-                    if not other_enemy.is_hit() and pygame.Rect(enemy.hitbox).colliderect(other_enemy.hitbox):
-                        other_enemy.hit()
-                        self.game.add_score(other_enemy)
+                self.detonate(enemy, order)
         # At least one invader has crossed the side border, and all reverse direction
-        if direction_swap_needed:
-            for invader in self.invaders:
-                invader.descend()
-                invader.swap_direction()
+        if self.formation is not None and self.formation.at_border():
+            self.formation.descend()
         # If some enemies have moved off the screen, they must be removed
-        for enemy in to_remove:
-            if isinstance(enemy, Asteroid):
-                self.asteroids.remove(enemy)
-            elif isinstance(enemy, Invader):
-                self.invaders.remove(enemy)
+        if enemies_gone:
+            gone_invaders = Enemies.compact(self.invaders)
+            for enemy in Enemies.compact(self.asteroids) + gone_invaders:
+                self.grid.remove(enemy)
+                self.targets.remove(enemy)
+                self.detonations.pop(enemy, None)
+                Animation.cancel(enemy)
+            for invader in gone_invaders:
+                if not invader.is_hit():
+                    self.formation.leave(invader.slot_x, invader.slot_y)
+            self.enemies = None
 
         # Move projectiles
-        projectiles_to_remove = []
+        projectiles_gone = False
         for projectile in self.projectiles:
             projectile.move()
             if projectile.is_away():
-                projectiles_to_remove.append(projectile)
-        for projectile in projectiles_to_remove:
-            self.projectiles.remove(projectile)
+                projectiles_gone = True
+        if projectiles_gone:
+            for projectile in Enemies.compact(self.projectiles):
+                Animation.cancel(projectile)
+        self.projectiles_grid.rebuild(self.projectiles)
 
     def draw(self):
         """
         Draw all existing enemies
         """
         for asteroid in self.asteroids:
-            self.game.screen.window.blit(asteroid.get_current_pic(), asteroid.get_xy())
+            self.game.screen.window.blit(asteroid.get_current_pic(), asteroid.get_drawn_xy())
             if Const.DEBUG:
                 pygame.draw.rect(self.game.screen.window, (255, 255, 0), asteroid.get_hitbox(), 1)
         for invader in self.invaders:
-            self.game.screen.window.blit(invader.get_current_pic(), invader.get_xy())
+            self.game.screen.window.blit(invader.get_current_pic(), invader.get_drawn_xy())
             if Const.DEBUG:
                 pygame.draw.rect(self.game.screen.window, (255, 0, 0), invader.get_hitbox(), 1)
         for projectile in self.projectiles:
@@ -1,21 +1,27 @@
 from interstellar import Interstellar
 from direction import Direction
 from resources import Resources
+from frame_cache import FrameCache
 
 import enum
 
 
 class Enemy(Interstellar):
+    __slots__ = ("score",)
+    # Image sets of enemies of a fixed size, built once per set and size and shared by all of them
+    sprite_sets = FrameCache()
+
     def __init__(self,
                  images,
                  speed,
-                 explode_images=Resources.explosion,
-                 explode_sounds=Resources.wav_explosion,
+                 explode_images=None,
+                 explode_sounds=None,
                  x=0, y=0):
+        # The defaults are resolved here rather than in the signature, so importing doesn't load the assets
         super().__init__(images=images,
                          speed=speed,
-                         explode_images=explode_images,
-                         explode_sounds=explode_sounds,
+                         explode_images=explode_images if explode_images is not None else Resources.explosion,
+                         explode_sounds=explode_sounds if explode_sounds is not None else Resources.wav_explosion,
                          x=x, y=y)
         self.score = 0
 
@@ -48,7 +54,8 @@ class Enemy(Interstellar):
 
     def move(self):
         if not self.away:
-            self.x, self.y = tuple(map(sum, zip((self.x, self.y), self.speed)))
+            self.x += self.speed[0]
+            self.y += self.speed[1]
             if self.off_the_screen():
                 self.away = True
         super().move()
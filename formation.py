@@ -0,0 +1,140 @@
+from const import Const
+from sim_clock import SimClock
+from animation import Animation
+
+
+class Formation:
+    """
+    The invaders of a level, which all move in lockstep. The formation moves once per tick for all of them:
+    it holds their common offset, speed and descend state, and each invader only keeps its place in it.
+    The columns and lines that still have invaders which aren't hit are counted, so that the side borders
+    and the top border are checked against the outermost of them only.
+    The invaders which aren't hit also share their animation, which goes back and forth over their pictures.
+    """
+
+    def __init__(self, descend_speed, horizontal_speed, descend_steps):
+        self.x, self.y = 0, 0
+        self.previous = (0, 0)  # The offset of the last tick, see Interstellar.get_drawn_xy()
+        self.speed = (0, Const.INVADER_ENTRY_SPEED)
+        self.descend_speed = descend_speed
+        self.horizontal_speed = horizontal_speed
+        self.descend_steps = descend_steps
+        self.descend_step = 0
+        self.descend_finished = True
+        self.entry_finished = False
+        # Invaders not hit, by their column and line
+        self.columns = {}
+        self.lines = {}
+        self.left = self.right = self.top = None
+        # The animation, once the first invader has joined
+        self.frames = None
+        self.frame_time = 0
+        self.frame_num = 0
+        self.frame_direction = 1
+        self.next_frame = 0
+
+    def join(self, x, y):
+        """
+        Count a new invader at the given place
+        """
+        self.columns[x] = self.columns.get(x, 0) + 1
+        self.lines[y] = self.lines.get(y, 0) + 1
+        self.left = x if self.left is None else min(self.left, x)
+        self.right = x if self.right is None else max(self.right, x)
+        self.top = y if self.top is None else min(self.top, y)
+
+    def leave(self, x, y):
+        """
+        Stop counting an invader, which is hit or gone. The outermost column or line is only looked for again
+        when the one left was the last of it.
+        """
+        self.columns[x] -= 1
+        if not self.columns[x]:
+            del self.columns[x]
+            if x in (self.left, self.right):
+                self.left = min(self.columns) if self.columns else None
+                self.right = max(self.columns) if self.columns else None
+        self.lines[y] -= 1
+        if not self.lines[y]:
+            del self.lines[y]
+            if y == self.top:
+                self.top = min(self.lines) if self.lines else None
+
+    def start_animation(self, frames, frame_time):
+        """
+        Animate the invaders over the given number of pictures
+        """
+        self.frames = frames
+        self.frame_time = frame_time
+        Animation.schedule(self, frame_time)
+
+    def animate(self):
+        """
+        Advance the picture of all invaders, see Animation. Once all are hit it isn't shown anymore, and stops.
+        """
+        self.frame_num += self.frame_direction
+        if self.frame_num > self.frames - 1:
+            self.frame_direction = -self.frame_direction
+            # The last frame will be shown twice, for showing it once multiply the direction by 2 below.
+            self.frame_num += self.frame_direction
+        elif self.frame_num < 0:
+            self.frame_direction = -self.frame_direction
+            # The first frame will be shown twice, for showing it once multiply the direction by 2 below.
+            self.frame_num += self.frame_direction
+        if self.columns:
+            Animation.schedule(self, self.frame_time)
+
+    def move(self):
+        """
+        Move the formation by a tick
+        """
+        self.previous = (self.x, self.y)
+        if self.entry_finished and not self.descend_finished:
+            self.descend_step += 1
+            if self.descend_step >= self.descend_steps:
+                self.descend_finished = True
+                self.speed = (self.horizontal_speed, 0)
+        self.x += self.speed[0]
+        self.y += self.speed[1]
+
+    def get_drawn_xy(self):
+        """
+        Return the offset to draw the invaders at, see Interstellar.get_drawn_xy()
+        """
+        if SimClock.alpha == 1:
+            return self.x, self.y
+        alpha = SimClock.alpha
+        previous_x, previous_y = self.previous
+        return previous_x + (self.x - previous_x) * alpha, previous_y + (self.y - previous_y) * alpha
+
+    def appeared(self):
+        """
+        Check if all invaders already appear on the screen
+        """
+        return self.top is None or self.y + self.top >= Const.INVADER_TOP_BORDER
+
+    def arrived(self, direction):
+        """
+        The formation has reached its nominal height, and starts moving to the given side
+        """
+        self.entry_finished = True
+        self.horizontal_speed *= direction.value
+        self.speed = (self.horizontal_speed, 0)
+
+    def at_border(self):
+        """
+        Check whether the outermost invaders have crossed the side border they are moving to
+        """
+        if self.left is None:
+            return False
+        return (self.x + self.right >= Const.INVADER_RIGHT_BORDER and self.speed[0] > 0 or
+                self.x + self.left <= Const.INVADER_LEFT_BORDER and self.speed[0] < 0)
+
+    def descend(self):
+        """
+        Descend, and then move to the other side
+        """
+        self.descend_step = 0
+        self.descend_finished = False
+        self.speed = (0, self.descend_speed)
+        self.horizontal_speed = -self.horizontal_speed
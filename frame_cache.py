@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+from interstellar import Interstellar
+import pygame
+
+
+class FrameCache:
+    """
+    Rescaled frame sets, shared by all objects that need the same frames in the same size.
+    A requested size is rounded down to a multiple of the bucket, so similar sizes share one set,
+    and once the capacity is reached the least recently used set is dropped.
+    The sets are shared, so they must never be modified by their users.
+    The collision masks of the frames are kept here as well, see FrameCache.mask().
+    """
+
+    def __init__(self, bucket=1, capacity=None):
+        self.bucket = bucket
+        self.capacity = capacity
+        self.sets = OrderedDict()
+        # By the frame itself, so a mask goes with its frame, and never outlives it to be taken for another's
+        self.masks = WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def quantize(self, size):
+        """
+        Return the bucket a size falls into
+        """
+        return max(self.bucket, int(size) - int(size) % self.bucket)
+
+    def scaled(self, images, width, height):
+        """
+        Return the images rescaled to the bucket of the given size.
+        The source is identified by its frames, so a set whose frames were replaced, see Resources.display_ready(),
+        is rescaled again rather than taken for the old one.
+        """
+        key = (tuple(images), self.quantize(width), self.quantize(height))
+        images_scaled = self.sets.get(key)
+        if images_scaled is None:
+            self.misses += 1
+            images_scaled = Interstellar.rescale(images_source=images, scale_x=key[1], scale_y=key[2])
+            self.sets[key] = images_scaled
+            # The capacity may have been lowered since the last set was added
+            while self.capacity is not None and len(self.sets) > self.capacity:
+                self.sets.popitem(last=False)
+        else:
+            self.hits += 1
+            self.sets.move_to_end(key)
+        return images_scaled
+
+    def mask(self, image):
+        """
+        Return the collision mask of a frame of a set returned by scaled(), built on first use
+        """
+        mask = self.masks.get(image)
+        if mask is None:
+            mask = self.masks[image] = pygame.mask.from_surface(image)
+        return mask
+
+    def clear(self):
+        """
+        Drop all sets and reset the counters
+        """
+        self.sets.clear()
+        self.masks.clear()
+        self.hits = 0
+        self.misses = 0
@@ -4,14 +4,19 @@ from spaceship import Spaceship
 from rocket import Rocket
 from direction import Direction
 from const import Const
-from random import randint
+from rng import Rng
 from player import Player
-from time import perf_counter as clock
+from text import Text
+from collision import Collision
+from sim_clock import SimClock
 import pygame
 import enum
 
 
 class Gameplay:
+    # A box without an area, which doesn't hit anything
+    NO_HITBOX = pygame.Rect(0, 0, 0, 0)
+
     def __init__(self, space, screen):
         self.space = space
         self.level = 0
@@ -28,7 +33,6 @@ class Gameplay:
         self.num_of_levels = 10
         self.__setup_levels()
         self.initialize_level()
-        self.level_font = pygame.font.Font("res/PixelEmulator-xq08.ttf", 24)
         self.notification_time = 0
         self.blinking_period = 0
         self.blinking_time = 0
@@ -37,6 +41,8 @@ class Gameplay:
         self.level_notification = False
         self.death_notification = False
         self.spaceship_state = self.SpaceshipState.normal
+        self.ticks = 0  # Ticks run, the key events are recorded by them
+        self.recording = None  # The Script the key events are recorded to, if any
 
     class Probability(enum.Enum):
         very_low = 100
@@ -146,7 +152,7 @@ class Gameplay:
                                      y=invader_location[1],
                                      speed=1)
         self.level_notification = True
-        self.notification_time = clock() + Const.NOTIFICATION_TIME
+        self.notification_time = SimClock.now() + Const.NOTIFICATION_TIME
 
     def end_level(self):
         """
@@ -168,7 +174,7 @@ class Gameplay:
     def spaceship_was_hit(self):
         self.spaceship.hit()
         self.death_notification = True
-        self.notification_time = clock() + Const.NOTIFICATION_TIME
+        self.notification_time = SimClock.now() + Const.NOTIFICATION_TIME
         self.player.hit()
         self.spaceship_state = self.SpaceshipState.hit
         # Don't call game_over() here - let the explosion animation finish first
@@ -176,38 +182,45 @@ class Gameplay:
 
     def check_hits(self):
         """
-        Check if a rocket or a spaceship hit something
+        Check if a rocket or a spaceship hit something.
+        The collision index of the enemies gives what the spaceship and each rocket overlap all at once,
+        and these are then handled in the enemies' order.
         """
-        for enemy in self.enemies.get_enemies():
+        enemies = self.enemies.get_enemies()
+        order = {enemy: number for number, enemy in enumerate(enemies)}
+        boxes = [self.spaceship.hitbox if self.spaceship_state == self.SpaceshipState.normal else self.NO_HITBOX]
+        boxes += [rocket.hitbox if rocket.is_launched() else self.NO_HITBOX for rocket in self.rockets]
+        spaceship_hits, *rocket_hits = [set(hits) for hits in self.enemies.grid.query_all(boxes)]
+        for enemy in sorted(spaceship_hits.union(*rocket_hits), key=order.get):
             # Spaceship
-            if self.spaceship_state == self.SpaceshipState.normal and \
-                    pygame.Rect(self.spaceship.hitbox).colliderect(enemy.hitbox):
+            if self.spaceship_state == self.SpaceshipState.normal and enemy in spaceship_hits and \
+                    Collision.precise(self.spaceship, enemy):
                 if not enemy.is_hit():
-                    enemy.hit()
+                    self.enemies.hit(enemy)
                 # Spaceship death. It can be hit by an exploding enemy as well.
                 self.spaceship_was_hit()
             # Rocket
-            for rocket in self.rockets:
-                if rocket.is_launched():
-                    if pygame.Rect(rocket.hitbox).colliderect(enemy.hitbox):
-                        rocket.gone()
-                        enemy.hit()
-                        self.add_score(enemy)
+            for rocket, hits in zip(self.rockets, rocket_hits):
+                if enemy in hits and Collision.precise(rocket, enemy):
+                    rocket.gone()
+                    self.enemies.hit(enemy)
+                    self.add_score(enemy)
 
+        projectiles = self.enemies.get_projectiles()
+        order = {projectile: number for number, projectile in enumerate(projectiles)}
         # Check if projectiles hit the spaceship
-        for projectile in self.enemies.get_projectiles():
-            if not projectile.is_hit():
-                if self.spaceship_state == self.SpaceshipState.normal and \
-                        pygame.Rect(self.spaceship.hitbox).colliderect(projectile.hitbox):
+        if self.spaceship_state == self.SpaceshipState.normal:
+            for projectile in sorted(self.enemies.projectiles_grid.query(self.spaceship.hitbox), key=order.get):
+                if not projectile.is_hit() and self.spaceship_state == self.SpaceshipState.normal and \
+                        Collision.precise(self.spaceship, projectile):
                     projectile.away = True
                     self.spaceship_was_hit()
 
         # Check if rockets hit projectiles
         for rocket in self.rockets:
             if rocket.is_launched():
-                for projectile in self.enemies.get_projectiles():
-                    if not projectile.is_hit() and \
-                            pygame.Rect(rocket.hitbox).colliderect(projectile.hitbox):
+                for projectile in sorted(self.enemies.projectiles_grid.query(rocket.hitbox), key=order.get):
+                    if not projectile.is_hit() and Collision.precise(rocket, projectile):
                         rocket.gone()
                         projectile.destroy()
                         # Small score bonus for shooting down projectiles (fixed 10 points)
@@ -226,8 +239,8 @@ class Gameplay:
         self.spaceship_state = self.SpaceshipState.blinking
         # Since during the explosion some basic parameters are changed, need to reinitialize
         self.spaceship.reinitialize()
-        self.blinking_period = clock() + Const.BLINKING_PERIOD
-        self.blinking_time = clock() + Const.BLINKING_PERIOD / 3  # Just some longer outage for the first blink
+        self.blinking_period = SimClock.now() + Const.BLINKING_PERIOD
+        self.blinking_time = SimClock.now() + Const.BLINKING_PERIOD / 3  # Just some longer outage for the first blink
         # The first blink will be longer, i.e. the spaceship will disappear for a while after explosion
         self.first_blink = True
         self.blink = True
@@ -236,6 +249,9 @@ class Gameplay:
         """
         Game running logic
         """
+        self.ticks += 1
+        # The background moves by the game as well, on top of its own pace in the menus
+        self.screen.move()
         # Enemies
         # Invaders may be still entering the screen
         if not self.invaders_in_place:
@@ -243,13 +259,13 @@ class Gameplay:
                 self.invaders_in_place = True
                 self.enemies.invaders_arrived()
         # Add a random asteroid
-        if randint(0, self.current_level().get_asteroids_probability().value) == 0:
+        if Rng.gameplay.randint(0, self.current_level().get_asteroids_probability().value) == 0:
             self.enemies.add_asteroid()
         # Invaders randomly shoot projectiles
         shooting_prob = self.current_level().get_shooting_probability()
         # Handle both enum and int values for shooting probability
         prob_value = shooting_prob.value if hasattr(shooting_prob, 'value') else shooting_prob
-        if self.invaders_in_place and randint(0, prob_value) == 0:
+        if self.invaders_in_place and Rng.gameplay.randint(0, prob_value) == 0:
             self.enemies.invader_shoot()
         # Move all enemies
         self.enemies.move()
@@ -266,15 +282,38 @@ class Gameplay:
             # The spaceship was hit and finished exploding
             self.spaceship_post_explosion()
 
+        # After an explosion of the spaceship, and reducing of one life, the spaceship
+        # will not appear for a while, and then appear blinking for few seconds.
+        self.blink_spaceship()
+
         # Game
         if self.end_level():
             self.next_level()
 
-    def handle_events(self):
+    def blink_spaceship(self):
         """
-        Handle all game events, mostly keypress
+        Switch the blink state of the spaceship while it is blinking, and bring it back to normal when it is over
         """
-        for event in pygame.event.get():
+        if SimClock.now() < self.blinking_period:
+            # Spaceship blinking was required
+            if SimClock.now() > self.blinking_time:
+                # Blinking duty cycle finished, switch the blink state
+                self.blink = not self.blink
+                self.first_blink = False
+                self.blinking_time = SimClock.now() + Const.BLINKING_TIME
+        elif self.spaceship_state == self.SpaceshipState.blinking:
+            # Spaceship blinking has just finished
+            self.spaceship_state = self.SpaceshipState.normal
+
+    def handle_events(self, events=None):
+        """
+        Handle all game events, mostly keypress. These are the pending pygame events,
+        unless others are given, e.g. by a bot. The key events are recorded, if the game is.
+        """
+        events = pygame.event.get() if events is None else events
+        if self.recording is not None:
+            self.recording.record(self.ticks, events)
+        for event in events:
             # Exit event
             if event.type == pygame.QUIT:
                 self.space.quit()
@@ -319,15 +358,8 @@ class Gameplay:
             if rocket.is_launched():
                 rocket.draw()
 
-        # After an explosion of the spaceship, and reducing of one life, the spaceship
-        # will not appear for a while, and then appear blinking for few seconds.
-        if clock() < self.blinking_period:
-            # Spaceship blinking was required
-            if clock() > self.blinking_time:
-                # Blinking duty cycle finished, switch the blink state
-                self.blink = not self.blink
-                self.first_blink = False
-                self.blinking_time = clock() + Const.BLINKING_TIME
+        # The spaceship is blinking for a while after an explosion, see blink_spaceship()
+        if SimClock.now() < self.blinking_period:
             if not self.blink:
                 # Only if the current blink state is False, draw the spaceship
                 self.rocket_left.draw()
@@ -335,9 +367,6 @@ class Gameplay:
                 self.spaceship.draw()
         else:
             # Spaceship blinking is not required or finished
-            if self.spaceship_state == self.SpaceshipState.blinking:
-                # Spaceship blinking has just finished
-                self.spaceship_state = self.SpaceshipState.normal
             if self.spaceship_state != self.SpaceshipState.hit:
                 # Draw the rockets only if the spaceship is not currently exploding
                 for rocket in self.rockets:
@@ -347,14 +376,14 @@ class Gameplay:
             self.spaceship.draw()
 
         # Handle the notifications
-        if clock() < self.notification_time:
+        if SimClock.now() < self.notification_time:
             label = ""
             if self.level_notification:
-                label = self.player.font.render("Level " + str(self.level + 1), True, Const.COLOR_WHITE)
+                label = Text.render("Level " + str(self.level + 1), Const.FONT_SIZE_TEXT, Const.COLOR_WHITE,
+                                    scale=Const.NOTIFICATION_SCALE)
             elif self.death_notification:
-                label = self.player.font.render("Lives:" + str(self.player.get_lives()), True, Const.COLOR_RED)
-            width, height = label.get_rect().size
-            label = pygame.transform.scale(label, (width * 4, height * 4))
+                label = Text.render("Lives:" + str(self.player.get_lives()), Const.FONT_SIZE_TEXT, Const.COLOR_RED,
+                                    scale=Const.NOTIFICATION_SCALE)
             width, height = label.get_rect().size
             x = (Const.SCREEN_WIDTH - width) / 2
             y = (Const.SCREEN_HEIGHT - height) / 2
@@ -0,0 +1,83 @@
+import argparse
+import os
+from time import perf_counter as clock
+
+# No window and no sound, so that it runs on a machine without them
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from space import Space
+from screen import Screen
+from resources import Resources
+from sim_clock import SimClock
+from bot import Bot
+from script import Script
+
+
+class Headless(Space):
+    """
+    The game without a window, sound or frame cap: its logic runs tick by tick as fast as it can,
+    played by a Bot or a Script, and nothing is drawn. The display is the dummy one of SDL,
+    which the images are still converted for.
+    To run it type "python headless.py", see "python headless.py --help" for the options.
+    """
+
+    def __init__(self, player):
+        Space.register_backends()
+        Resources.disable_audio()
+        pygame.init()
+        self.screen = Screen()
+        self.game = None
+        self.recording_path = None
+        self.menu = None
+        self.loading = Resources.preload(["gameplay"], background=True)
+        self.running = True
+        self.game_state = self.GameState.MENU
+        self.lag = 0
+        self.player = player
+
+    def game_over(self):
+        """
+        The game is over, there is no menu to show
+        """
+        self.game_state = self.GameState.GAME_OVER
+
+    def victory(self):
+        """
+        See game_over()
+        """
+        self.game_state = self.GameState.VICTORY
+
+    def main(self, ticks, seed=None):
+        """
+        Play a game for at most the given number of ticks, return how many were played.
+        A script recorded of a game plays it with the random numbers it was recorded with, see Rng.
+        """
+        recorded = getattr(self.player, "seed", None)
+        self.start_game(seed if recorded is None else recorded)
+        played = 0
+        while self.running and self.game_state == self.GameState.PLAYING and played < ticks:
+            self.game.handle_events(self.player.events(self.game))
+            self.tick()
+            played += 1
+        return played
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Run the game without a window, as fast as it can")
+    parser.add_argument("--ticks", type=int, default=36000, help="most ticks to play, 10 minutes by default")
+    parser.add_argument("--script", help="a file of key events to play, the bot plays if none is given")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the random numbers, unless the script has one")
+    args = parser.parse_args()
+    pygame.init()  # The key names of a script are looked up by pygame
+    headless = Headless(Script.load(args.script) if args.script else Bot())
+    start = clock()
+    ticks = headless.main(args.ticks, args.seed)
+    elapsed = clock() - start
+    game = headless.game
+    print("%d ticks in %.2f s: %.0f ticks per second, %.1f times as fast as playing at %d ticks per second" %
+          (ticks, elapsed, ticks / elapsed, ticks / elapsed * SimClock.step, 1 / SimClock.step))
+    print("%s on level %d, score %d, %d lives left" %
+          (headless.game_state.name.replace("_", " ").capitalize(), game.level + 1, game.player.get_score(),
+           game.player.get_lives()))
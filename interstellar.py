@@ -1,9 +1,18 @@
 import pygame
 from const import Const
-from random import randint
+from resources import Resources
+from sim_clock import SimClock
+from animation import Animation
+from rng import Rng
 
 
 class Interstellar:
+    # The objects keep their attributes in slots rather than in a __dict__, as there can be many of them.
+    # What can be told from the frame sets is not kept per object, see the properties below.
+    __slots__ = ("original_images", "images", "speed", "x", "y", "width", "height", "away", "hitbox", "hitsize",
+                 "frame_time", "next_frame", "frame_num", "current_image_set", "allow_off_the_screen", "exploding",
+                 "explode_images", "explode_sounds", "previous")
+
     def __init__(self, images, speed, explode_images=None, explode_sounds=None, x=0, y=0):
         self.original_images = images
         self.images = self.original_images
@@ -11,9 +20,8 @@ class Interstellar:
         self.x, self.y = x, y
         self.width, self.height = 0, 0
         self.away = False
-        self.hitbox = (0, 0, 0, 0)
+        self.hitbox = pygame.Rect(0, 0, 0, 0)  # Updated in place, never replaced
         self.hitsize = (0, 0, 0, 0)
-        self.num_of_images = len(self.images) if self.images else 0
         self.frame_time = Const.FRAME_TIME_SEC
         self.next_frame = 0
         self.frame_num = 0
@@ -22,10 +30,28 @@ class Interstellar:
         self.exploding = False
         self.explode_images = explode_images
         self.explode_sounds = explode_sounds
-        if explode_images:
-            self.num_of_explosion_frames = len(self.explode_images) - 1
-        if explode_sounds:
-            self.num_of_explode_sounds = len(explode_sounds) - 1
+        self.previous = None  # The position of the last tick, None when not known
+
+    @property
+    def num_of_images(self):
+        """
+        The number of pictures
+        """
+        return len(self.images) if self.images else 0
+
+    @property
+    def num_of_explosion_frames(self):
+        """
+        The number of the last explosion picture
+        """
+        return len(self.explode_images) - 1
+
+    @property
+    def num_of_explode_sounds(self):
+        """
+        The number of the last explosion sound
+        """
+        return len(self.explode_sounds) - 1
 
     def get_xy(self):
         """
@@ -33,6 +59,23 @@ class Interstellar:
         """
         return self.x, self.y
 
+    def keep_position(self):
+        """
+        Keep the position before it moves by a tick, see get_drawn_xy()
+        """
+        self.previous = (self.x, self.y)
+
+    def get_drawn_xy(self):
+        """
+        Return the position to draw at, between the ones of the last two ticks by SimClock.alpha,
+        so that frames drawn more often than the ticks still show a smooth motion
+        """
+        if self.previous is None or SimClock.alpha == 1:
+            return self.x, self.y
+        previous_x, previous_y = self.previous
+        alpha = SimClock.alpha
+        return previous_x + (self.x - previous_x) * alpha, previous_y + (self.y - previous_y) * alpha
+
     def get_hitbox(self):
         """
         Return the hitbox
@@ -52,7 +95,13 @@ class Interstellar:
         """
         # Move the hitbox only if the hit width is > 0, otherwise it isn't a hittable object
         if self.hitsize[2] != 0:
-            self.hitbox = tuple(map(sum, zip((self.x, self.y, -self.hitsize[0], -self.hitsize[1]), self.hitsize)))
+            self.hitbox.update(self.x + self.hitsize[0], self.y + self.hitsize[1],
+                               self.hitsize[2] - self.hitsize[0], self.hitsize[3] - self.hitsize[1])
+
+    def animate(self):
+        """
+        Advance the picture, see Animation. Only the objects which are animated schedule it.
+        """
 
     def get_current_pic(self):
         """
@@ -60,6 +109,13 @@ class Interstellar:
         """
         return self.images[self.frame_num]
 
+    def get_mask(self):
+        """
+        Return the collision mask of the current picture and its position, for the precise collision mode.
+        None means the whole hitbox is solid, which is also the case while exploding.
+        """
+        return None
+
     def is_away(self):
         """
         Return true if the object is off the screen
@@ -85,13 +141,13 @@ class Interstellar:
         return self.height
 
     @staticmethod
-    def rescale(images_source, scale_x, scale_y):
+    def rescale(images_source, scale_x, scale_y, mode=Resources.RLE):
         """
-        Rescale images
+        Rescale images, and prepare them for blitting
         """
         images_target = []
         for image in images_source:
-            images_target.append(pygame.transform.scale(image, (scale_x, scale_y)))
+            images_target.append(Resources.prepare(pygame.transform.scale(image, (scale_x, scale_y)), mode))
         return images_target
 
     def off_the_screen(self):
@@ -113,6 +169,7 @@ class Interstellar:
         self.frame_num = 0
         self.frame_time = Const.EXPLOSION_ANIMATE_SPEED
         self.current_image_set = self.explode_images
+        self.previous = None  # The explosion appears where the object is
         orig_width = self.width
         orig_height = self.height
         self.width, self.height = self.current_image_set[0].get_rect().size
@@ -120,6 +177,7 @@ class Interstellar:
         self.y = self.y - self.height // 2 + orig_height // 2
         self.hitsize = (Const.EXPLOSION_HIT_DELTA, Const.EXPLOSION_HIT_DELTA,
                         self.width - Const.EXPLOSION_HIT_DELTA, self.height - Const.EXPLOSION_HIT_DELTA)
+        Animation.schedule(self, self.frame_time)
         if self.explode_sounds:
-            explosion = self.explode_sounds[randint(0, self.num_of_explode_sounds)]
+            explosion = self.explode_sounds[Rng.cosmetic.randint(0, self.num_of_explode_sounds)]
             explosion.play()
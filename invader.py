@@ -1,76 +1,80 @@
 from enemy import Enemy
-from time import perf_counter as clock
+from interstellar import Interstellar
+from animation import Animation
 from const import Const
 
 
 class Invader(Enemy):
-    def __init__(self, images, x, y,
-                 descend_speed, horizontal_speed, descend_steps):
-        super().__init__(images=images, speed=(0, 0), x=x, y=y)
-        self.next_frame = 0
-        self.frame_num = 0
-        self.frame_direction = 1
-        self.exploding = False
+    """
+    An invader moves with its formation, and only keeps its place in it
+    """
+    __slots__ = ("formation", "slot_x", "slot_y", "can_shoot")
+
+    def __init__(self, images, x, y, formation):
+        self.formation = formation
+        super().__init__(images=images, speed=formation.speed, x=x, y=y)
         self.frame_time = Const.EXPLOSION_ANIMATE_SPEED
-        self.images = self.rescale(images_source=self.original_images,
-                                   scale_x=Const.INVADER_SIZE,
-                                   scale_y=Const.INVADER_SIZE)  # Square invader
-        self.num_of_images = len(self.images) - 1
+        # The whole formation shares one set of images, only the frame number is per invader
+        self.images = Enemy.sprite_sets.scaled(images=self.original_images,
+                                               width=Const.INVADER_SIZE,
+                                               height=Const.INVADER_SIZE)  # Square invader
         self.current_image_set = self.images
         self.width, self.height = self.images[0].get_rect().size
         self.hitsize = tuple(map(sum, zip((0, 0, self.width, self.height), Const.INVADER_HITSIZE)))
-        self.descend_steps = descend_steps
-        self.descend_step = 0
-        self.descend_speed = descend_speed
-        self.horizontal_speed = horizontal_speed
-        self.descend_finished = True
-        self.entry_finished = False
-        self.speed = (0, Const.INVADER_ENTRY_SPEED)
         self.allow_off_the_screen = True
         self.score = 100
         self.can_shoot = False  # Only shoot after entry is finished
+        formation.join(self.slot_x, self.slot_y)
+        if formation.frames is None:
+            # The invaders are animated all together until hit, see Formation.animate()
+            formation.start_animation(len(self.images), self.frame_time)
 
-    def set_speed(self, speed):
+    @property
+    def x(self):
         """
-        Set invader speed (tuple)
+        The position is the formation's, offset by the invader's place in it
         """
-        self.speed = speed
+        return self.formation.x + self.slot_x
 
-    def move_aside(self, direction):
-        """
-        Horizontal invader movement
-        """
-        self.horizontal_speed *= direction.value
-        self.speed = (self.horizontal_speed, 0)
+    @x.setter
+    def x(self, x):
+        self.slot_x = x - self.formation.x
 
-    def swap_direction(self):
+    @property
+    def y(self):
         """
-        Start moving to the other horizontal direction
+        See x
         """
-        self.horizontal_speed = -self.horizontal_speed
+        return self.formation.y + self.slot_y
 
-    def descend(self):
-        """
-        Invader will begin descent, i.e. moving down
-        """
-        self.descend_step = 0
-        self.descend_finished = False
-        self.speed = (0, self.descend_speed)
+    @y.setter
+    def y(self, y):
+        self.slot_y = y - self.formation.y
 
-    def get_descend_finished(self):
+    @property
+    def speed(self):
         """
-        Return whether the descend has finished
+        All invaders move at the speed of the formation
         """
-        return self.descend_finished
+        return self.formation.speed
 
-    def arrived(self, direction):
+    @speed.setter
+    def speed(self, speed):
+        self.formation.speed = speed
+
+    def arrived(self):
         """
         Command the invader that it arrived to the starting position on the screen
         """
-        self.entry_finished = True
         self.allow_off_the_screen = False
         self.can_shoot = True  # Enable shooting once in position
-        self.move_aside(direction)
+
+    def get_drawn_xy(self):
+        """
+        The invader is drawn at its place in the formation
+        """
+        x, y = self.formation.get_drawn_xy()
+        return x + self.slot_x, y + self.slot_y
 
     def get_projectile_spawn_position(self):
         """
@@ -82,35 +86,42 @@ class Invader(Enemy):
 
     def move(self):
         """
-        Move the invader according to its direction and state
+        The formation has already moved the invader, only check if it is off the screen and move its hitbox
+        """
+        if not self.away and self.off_the_screen():
+            self.away = True
+        Interstellar.move(self)
+
+    def hit(self):
+        """
+        Cause the invader to become hit, which takes it out of the formation's count
+        """
+        if not self.exploding:
+            self.formation.leave(self.slot_x, self.slot_y)
+        super().hit()
+
+    def get_mask(self):
+        """
+        Return the mask of the current frame and its position, None while exploding
+        """
+        if self.exploding:
+            return None
+        return Enemy.sprite_sets.mask(self.images[self.formation.frame_num]), (int(self.x), int(self.y))
+
+    def animate(self):
+        """
+        Advance the explosion, see Animation. Until then the formation animates the invader.
         """
-        if self.entry_finished:
-            if not self.descend_finished:
-                self.descend_step += 1
-                if self.descend_step >= self.descend_steps:
-                    self.descend_finished = True
-                    self.speed = (self.horizontal_speed, 0)
-        super().move()
+        if self.frame_num < self.num_of_explosion_frames:
+            self.frame_num += 1
+            Animation.schedule(self, self.frame_time)
+        else:
+            self.away = True
 
     def get_current_pic(self):
         """
         Return the current image of the invader
         """
-        if clock() > self.next_frame:
-            if self.exploding:
-                if self.frame_num < self.num_of_explosion_frames:
-                    self.frame_num += 1
-                else:
-                    self.away = True
-            else:
-                self.frame_num += self.frame_direction
-                if self.frame_num > self.num_of_images:
-                    self.frame_direction = -self.frame_direction
-                    # The last frame will be shown twice, for showing it once multiply the direction by 2 below.
-                    self.frame_num += self.frame_direction
-                elif self.frame_num < 0:
-                    self.frame_direction = -self.frame_direction
-                    # The first frame will be shown twice, for showing it once multiply the direction by 2 below.
-                    self.frame_num += self.frame_direction
-            self.next_frame = clock() + self.frame_time
-        return self.current_image_set[self.frame_num]
+        if self.exploding:
+            return self.current_image_set[self.frame_num]
+        return self.images[self.formation.frame_num]
@@ -1,5 +1,5 @@
-import pygame
 from const import Const
+from text import Text
 from time import perf_counter as clock
 
 
@@ -10,9 +10,6 @@ class Menu:
 
     def __init__(self, screen):
         self.screen = screen
-        self.font_title = pygame.font.Font("res/PixelEmulator-xq08.ttf", 48)
-        self.font_menu = pygame.font.Font("res/PixelEmulator-xq08.ttf", 32)
-        self.font_subtitle = pygame.font.Font("res/PixelEmulator-xq08.ttf", 24)
 
         # Menu options
         self.menu_options = ["Start Game", "Exit"]
@@ -44,7 +41,7 @@ class Menu:
     def draw_main_menu(self):
         """Draw the main menu screen"""
         # Draw title
-        title = self.font_title.render("SPACE GAME", True, Const.COLOR_WHITE)
+        title = Text.render("SPACE GAME", Const.FONT_SIZE_TITLE, Const.COLOR_WHITE)
         title_width, title_height = title.get_rect().size
         title_x = (Const.SCREEN_WIDTH - title_width) / 2
         title_y = Const.SCREEN_HEIGHT / 4
@@ -61,7 +58,7 @@ class Menu:
                 color = Const.COLOR_WHITE
                 prefix = "  "
 
-            option_text = self.font_menu.render(prefix + option, True, color)
+            option_text = Text.render(prefix + option, Const.FONT_SIZE_MENU, color)
             option_width, option_height = option_text.get_rect().size
             option_x = (Const.SCREEN_WIDTH - option_width) / 2
             option_y = menu_start_y + i * (option_height + 20)
@@ -83,14 +80,14 @@ class Menu:
             self.animation_y_offset = Const.SCREEN_HEIGHT / 3
 
         # Draw "GAME OVER" text
-        game_over_text = self.font_title.render("GAME OVER", True, Const.COLOR_RED)
+        game_over_text = Text.render("GAME OVER", Const.FONT_SIZE_TITLE, Const.COLOR_RED)
         text_width, text_height = game_over_text.get_rect().size
         text_x = (Const.SCREEN_WIDTH - text_width) / 2
         self.screen.window.blit(game_over_text, (text_x, self.animation_y_offset))
 
         # Draw score below after animation settles
         if elapsed > 1.5:
-            score_text = self.font_subtitle.render(f"Final Score: {str(score).zfill(6)}", True, Const.COLOR_WHITE)
+            score_text = Text.render(f"Final Score: {str(score).zfill(6)}", Const.FONT_SIZE_TEXT, Const.COLOR_WHITE)
             score_width, score_height = score_text.get_rect().size
             score_x = (Const.SCREEN_WIDTH - score_width) / 2
             score_y = self.animation_y_offset + text_height + 40
@@ -98,7 +95,7 @@ class Menu:
 
         # Draw "Press ENTER to continue" after animation completes
         if elapsed > 2.5:
-            continue_text = self.font_subtitle.render("Press ENTER to continue", True, Const.COLOR_WHITE)
+            continue_text = Text.render("Press ENTER to continue", Const.FONT_SIZE_TEXT, Const.COLOR_WHITE)
             continue_width, continue_height = continue_text.get_rect().size
             continue_x = (Const.SCREEN_WIDTH - continue_width) / 2
             continue_y = Const.SCREEN_HEIGHT - Const.SCREEN_HEIGHT / 4
@@ -126,20 +123,20 @@ class Menu:
 
         # Draw "VICTORY!" text with a golden color
         victory_color = (255, 215, 0)  # Gold color
-        victory_text = self.font_title.render("VICTORY!", True, victory_color)
+        victory_text = Text.render("VICTORY!", Const.FONT_SIZE_TITLE, victory_color)
         text_width, text_height = victory_text.get_rect().size
         text_x = (Const.SCREEN_WIDTH - text_width) / 2
         self.screen.window.blit(victory_text, (text_x, self.animation_y_offset))
 
         # Draw score below after animation settles
         if elapsed > 1.5:
-            score_text = self.font_subtitle.render(f"Final Score: {str(score).zfill(6)}", True, Const.COLOR_WHITE)
+            score_text = Text.render(f"Final Score: {str(score).zfill(6)}", Const.FONT_SIZE_TEXT, Const.COLOR_WHITE)
             score_width, score_height = score_text.get_rect().size
             score_x = (Const.SCREEN_WIDTH - score_width) / 2
             score_y = self.animation_y_offset + text_height + 40
             self.screen.window.blit(score_text, (score_x, score_y))
 
-            congrats_text = self.font_subtitle.render("You saved the galaxy!", True, Const.COLOR_WHITE)
+            congrats_text = Text.render("You saved the galaxy!", Const.FONT_SIZE_TEXT, Const.COLOR_WHITE)
             congrats_width, congrats_height = congrats_text.get_rect().size
             congrats_x = (Const.SCREEN_WIDTH - congrats_width) / 2
             congrats_y = score_y + score_height + 20
@@ -147,7 +144,7 @@ class Menu:
 
         # Draw "Press ENTER to continue" after animation completes
         if elapsed > 2.5:
-            continue_text = self.font_subtitle.render("Press ENTER to continue", True, Const.COLOR_WHITE)
+            continue_text = Text.render("Press ENTER to continue", Const.FONT_SIZE_TEXT, Const.COLOR_WHITE)
             continue_width, continue_height = continue_text.get_rect().size
             continue_x = (Const.SCREEN_WIDTH - continue_width) / 2
             continue_y = Const.SCREEN_HEIGHT - Const.SCREEN_HEIGHT / 4
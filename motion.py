@@ -0,0 +1,70 @@
+import heapq
+import itertools
+from const import Const
+
+
+class Motion:
+    """
+    The clock of objects moving at a constant speed, which keep where and when they started rather than being
+    moved by every tick: their position is origin + speed * (tick - start), worked out only when it is read.
+    When an object leaves the screen is known in advance as well, the objects are kept by that tick in a heap,
+    and are only told by their depart() method when it comes.
+    The speeds are multiples of 1 / Const.MOTION_RESOLUTION, and the starting positions whole numbers, so the
+    sums are exact, and the positions are the same as adding the speed tick by tick.
+    """
+
+    def __init__(self):
+        self.tick = 0
+        # (tick, number, object, version), the number keeps the order of objects leaving at the same tick
+        self.departures = []
+        self.numbers = itertools.count()
+
+    @staticmethod
+    def quantize(speed):
+        """
+        Return the nearest speed that can be moved by without rounding errors
+        """
+        return round(speed * Const.MOTION_RESOLUTION) / Const.MOTION_RESOLUTION
+
+    @staticmethod
+    def crossing(position, speed, limit, after):
+        """
+        Return the first step after the given one at which position + speed * step is beyond limit, None if never
+        """
+        step = after + 1
+        if speed <= 0:
+            return step if position + speed * step > limit else None
+        # The estimate is only corrected by the exact comparison, which is the one moving by steps makes
+        step = max(step, int((limit - position) / speed))
+        while step > after + 1 and position + speed * (step - 1) > limit:
+            step -= 1
+        while not position + speed * step > limit:
+            step += 1
+        return step
+
+    def schedule(self, obj):
+        """
+        Keep an object by the tick it leaves the screen at, as told by its departure() method.
+        Any earlier tick it was kept by is forgotten, so this is called again whenever its motion changes.
+        """
+        obj.version += 1
+        tick = obj.departure()
+        if tick is not None:
+            heapq.heappush(self.departures, (tick, next(self.numbers), obj, obj.version))
+
+    def cancel(self, obj):
+        """
+        Forget when an object leaves the screen, as it doesn't by moving anymore
+        """
+        obj.version += 1
+
+    def advance(self):
+        """
+        Move on by a tick, letting the objects which leave the screen by it depart
+        """
+        self.tick += 1
+        departures = self.departures
+        while departures and departures[0][0] <= self.tick:
+            _, _, obj, version = heapq.heappop(departures)
+            if obj.version == version:
+                obj.depart()
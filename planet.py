@@ -1,6 +1,7 @@
-from random import randint
+from rng import Rng
 from const import Const
 from interstellar import Interstellar
+from resources import Resources
 import pygame
 
 
@@ -8,10 +9,16 @@ class Planet(Interstellar):
     """
     A planet is just there for the background. It has no hitsize, and therefore is completely passive.
     """
+    __slots__ = ("blit_flags",)
+
     def __init__(self, images, speed, x=0, y=0):
         super().__init__(images=images, speed=speed, x=x, y=y)
         orig_width, orig_height = self.original_images[0].get_rect().size
-        new_size = randint(Const.PLANET_MIN_SIZE, orig_width) / orig_width  # Assuming the planets are square images
-        new_angle = randint(0, 179)
-        self.images = [pygame.transform.rotozoom(self.original_images[0], new_angle, new_size)]
+        # Assuming the planets are square images
+        new_size = Rng.cosmetic.randint(Const.PLANET_MIN_SIZE, orig_width) / orig_width
+        new_angle = Rng.cosmetic.randint(0, 179)
+        planet = pygame.transform.rotozoom(self.original_images[0], new_angle, new_size)
+        # Planets are large and mostly half transparent, so they are blended premultiplied
+        self.images = [Resources.prepare(planet, Resources.PREMULTIPLIED)]
+        self.blit_flags = Resources.blit_flags(Resources.PREMULTIPLIED)
         self.width, self.height = self.images[0].get_rect().size
@@ -1,5 +1,6 @@
 from const import Const
 from resources import Resources
+from text import Text
 import pygame
 
 
@@ -9,10 +10,10 @@ class Player:
         self.score = 0
         self.screen = screen
         # Resize the spaceship image to small scale
-        self.image = pygame.transform.scale(Resources.ship_move_right[0],
-                                            (Const.PLAYER_LIVE_SIZE, Const.PLAYER_LIVE_SIZE))
+        self.image = Resources.prepare(pygame.transform.scale(Resources.ship_move_right[0],
+                                                              (Const.PLAYER_LIVE_SIZE, Const.PLAYER_LIVE_SIZE)),
+                                       Resources.RLE)
         self.image_width, _ = self.image.get_rect().size
-        self.font = pygame.font.Font("res/PixelEmulator-xq08.ttf", 24)
 
     def get_score(self):
         """
@@ -51,5 +52,5 @@ class Player:
             position = tuple(map(sum, zip((shift, 0), Const.PLAYER_LIVES_POSITION)))
             self.screen.window.blit(self.image, position)
         # Draw the score as a zero-padded six digit number
-        score = self.font.render(str(self.score).zfill(6), True, Const.COLOR_WHITE)
+        score = Text.render(str(self.score).zfill(6), Const.FONT_SIZE_TEXT, Const.COLOR_WHITE)
         self.screen.window.blit(score, Const.PLAYER_SCORE_POSITION)
@@ -1,56 +1,80 @@
 import pygame
 from const import Const
-from time import perf_counter as clock
+from motion import Motion
+from sim_clock import SimClock
+from animation import Animation
 
 
 class Projectile:
     """
-    Enemy projectile that falls downward and can hit the player's spaceship
+    Enemy projectile that falls downward and can hit the player's spaceship.
+    It falls at a constant speed, so it is moved by its Motion rather than tick by tick, see Asteroid.
     """
+    __slots__ = ("x", "origin_y", "start", "motion", "version", "away", "hit", "exploding", "explosion_frame",
+                 "explosion_time", "next_frame", "hitbox")
+    # The same for all projectiles
+    speed = Const.PROJECTILE_SPEED
+    width = Const.PROJECTILE_WIDTH
+    height = Const.PROJECTILE_HEIGHT
+    color = Const.PROJECTILE_COLOR
+    core_color = Const.PROJECTILE_CORE_COLOR
 
-    def __init__(self, x, y):
+    def __init__(self, x, y, motion=None):
+        self.motion = motion if motion is not None else Motion()
+        self.version = 0
         self.x = x - Const.PROJECTILE_WIDTH / 2  # Center it
-        self.y = y
-        self.speed = Const.PROJECTILE_SPEED
-        self.width = Const.PROJECTILE_WIDTH
-        self.height = Const.PROJECTILE_HEIGHT
-        self.color = Const.PROJECTILE_COLOR
-        self.core_color = Const.PROJECTILE_CORE_COLOR
+        self.origin_y = y
+        self.start = self.motion.tick
         self.away = False
         self.hit = False
         self.exploding = False
         self.explosion_frame = 0
         self.explosion_time = 0
-        self.hitbox = None
-        self.update_hitbox()
+        self.next_frame = 0
+        self.hitbox = pygame.Rect(self.x, self.y, self.width, self.height)  # Updated in place, never replaced
+        self.motion.schedule(self)
+
+    @property
+    def y(self):
+        """Where the projectile started, moved down for every tick since, until it explodes"""
+        if self.exploding:
+            return self.origin_y
+        return self.origin_y + self.speed * (self.motion.tick - self.start)
+
+    def departure(self):
+        """Return the tick at which the projectile is off the screen"""
+        return self.start + Motion.crossing(self.origin_y, self.speed, Const.SCREEN_HEIGHT,
+                                            self.motion.tick - self.start)
+
+    def depart(self):
+        """The projectile has left the screen, see Motion"""
+        self.away = True
 
     def update_hitbox(self):
         """Update the projectile's hitbox"""
-        self.hitbox = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.hitbox.update(self.x, self.y, self.width, self.height)
 
     def destroy(self):
         """Trigger explosion animation"""
+        self.origin_y = self.y  # It stays there
+        self.motion.cancel(self)
         self.hit = True
         self.exploding = True
-        self.explosion_time = clock()
+        self.explosion_time = SimClock.now()
+        Animation.schedule(self, 0.1)  # Short explosion
 
     def is_hit(self):
         """Check if projectile was hit"""
         return self.hit
 
     def move(self):
-        """Move the projectile downward"""
+        """The projectile has already moved down with its Motion, and is set away by it, only move its hitbox"""
         if not self.exploding:
-            self.y += self.speed
             self.update_hitbox()
 
-            # Remove if it goes off screen
-            if self.y > Const.SCREEN_HEIGHT:
-                self.away = True
-        else:
-            # Handle explosion animation
-            if clock() - self.explosion_time > 0.1:  # Short explosion
-                self.away = True
+    def animate(self):
+        """The explosion is over, see Animation"""
+        self.away = True
 
     def is_away(self):
         """Check if the projectile should be removed"""
@@ -60,28 +84,39 @@ class Projectile:
         """Return the position"""
         return self.x, self.y
 
+    def get_drawn_xy(self):
+        """Return the position to draw at, back by its speed at the last tick, see Interstellar.get_drawn_xy()"""
+        if self.exploding:
+            return self.x, self.y
+        return self.x, self.y - self.speed * (1 - SimClock.alpha)
+
+    def get_mask(self):
+        """A projectile is a solid box, so its hitbox is precise"""
+        return None
+
     def draw(self, screen):
         """Draw the projectile with a pixelated retro look"""
+        x, y = self.get_drawn_xy()
         if self.exploding:
             # Draw simple explosion effect (expanding circle)
-            radius = int(8 * (clock() - self.explosion_time) / 0.1)
+            radius = int(8 * (SimClock.now() - self.explosion_time) / 0.1)
             pygame.draw.circle(screen, (255, 150, 0),
-                             (int(self.x + self.width/2), int(self.y + self.height/2)),
+                             (int(x + self.width/2), int(y + self.height/2)),
                              radius)
         else:
             # Draw pixelated projectile shape (like a classic laser bolt)
             # Outer pixels
-            pygame.draw.rect(screen, self.color, self.hitbox)
+            pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
 
             # Inner bright core (2 pixels narrower on each side)
-            core_rect = pygame.Rect(self.x + 2, self.y + 2, self.width - 4, self.height - 4)
+            core_rect = pygame.Rect(x + 2, y + 2, self.width - 4, self.height - 4)
             pygame.draw.rect(screen, self.core_color, core_rect)
 
             # Top and bottom pixels for shape
             tip_width = max(2, self.width - 4)
-            top_rect = pygame.Rect(self.x + (self.width - tip_width)/2, self.y, tip_width, 2)
-            bottom_rect = pygame.Rect(self.x + (self.width - tip_width)/2,
-                                     self.y + self.height - 2, tip_width, 2)
+            top_rect = pygame.Rect(x + (self.width - tip_width)/2, y, tip_width, 2)
+            bottom_rect = pygame.Rect(x + (self.width - tip_width)/2,
+                                     y + self.height - 2, tip_width, 2)
             pygame.draw.rect(screen, self.core_color, top_rect)
             pygame.draw.rect(screen, self.core_color, bottom_rect)
 
@@ -0,0 +1,24 @@
+from random import Random, SystemRandom
+
+
+class Rng:
+    """
+    The random numbers of a game, in two streams seeded from one seed: the gameplay stream for whatever
+    changes how the game goes, and the cosmetic one for whatever is only shown or heard. Taking a cosmetic number
+    never moves the gameplay stream on, so the game goes the same with the same seed and the same input,
+    see Script for recording and replaying the input.
+    """
+    gameplay = Random()
+    cosmetic = Random()
+    seed = None
+
+    @staticmethod
+    def start(seed=None):
+        """
+        Seed both streams for a new game. Without a seed a random one is taken, either is kept in Rng.seed.
+        """
+        if seed is None:
+            seed = SystemRandom().randrange(2 ** 32)
+        Rng.seed = seed
+        Rng.gameplay.seed("gameplay %d" % seed)
+        Rng.cosmetic.seed("cosmetic %d" % seed)
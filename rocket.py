@@ -1,5 +1,7 @@
 from time import perf_counter as clock
-from random import randint
+from weakref import WeakKeyDictionary
+from animation import Animation
+from rng import Rng
 from direction import Direction
 from resources import Resources
 from const import Const
@@ -9,8 +11,18 @@ import pygame
 
 
 class Rocket(Interstellar):
+    __slots__ = ("spaceship", "current_pic_num", "on_board", "side", "launch_sound")
+    # Rotated rocket images by launch angle step, shared by both rockets
+    atlas = None
+    atlas_build_time = 0
+    atlas_bytes = 0
+    # Collision masks of the unrotated and of the atlas images, by the picture itself, see FrameCache.masks
+    masks = WeakKeyDictionary()
+
     def __init__(self, spaceship, side):
         super().__init__(Resources.rocket, speed=0, x=0, y=0)
+        if Rocket.atlas is None:
+            Rocket.build_atlas()
         self.spaceship = spaceship
         self.speed = (0, Const.ROCKET_INITIAL_SPEED)
         self.width, self.height = self.images[0].get_rect().size
@@ -24,11 +36,44 @@ class Rocket(Interstellar):
         self.x = 0
         self.y = 0
 
+    @staticmethod
+    def max_angle_step():
+        """
+        Return the number of angle steps to the largest angle a rocket can be launched at, in either direction
+        """
+        max_angle = Const.SPACESHIP_MAX_SPEED / Const.ROCKET_HORIZONTAL_SPEED_DELTA * Const.ROCKET_ANGLE_RATIO
+        return int(max_angle / Const.ROCKET_ANGLE_STEP + 0.5)
+
+    @classmethod
+    def build_atlas(cls):
+        """
+        Rotate the rocket images once for every launch angle step, so that a launch only has to pick them
+        """
+        start = clock()
+        max_step = cls.max_angle_step()
+        cls.atlas = {}
+        for step in range(-max_step, max_step + 1):
+            cls.atlas[step] = [Utils.rotate(image, step * Const.ROCKET_ANGLE_STEP) for image in Resources.rocket]
+        cls.atlas_build_time = clock() - start
+        cls.atlas_bytes = sum(image.get_bytesize() * image.get_width() * image.get_height()
+                              for images in cls.atlas.values() for image in images)
+
+    def get_mask(self):
+        """
+        Return the mask of the current picture and its position
+        """
+        pic = self.get_current_pic()
+        mask = Rocket.masks.get(pic)
+        if mask is None:
+            mask = Rocket.masks[pic] = pygame.mask.from_surface(pic)
+        return mask, (int(self.x), int(self.y))
+
     def move(self):
         """
         If the rocket is on board, it will be moving with the spaceship
         on the x axis, and when fired - it will move on the y axis as well
         """
+        self.keep_position()
         if not self.is_launched():
             # The rocket is on board
             self.x, self.y = self.spaceship.get_xy()
@@ -41,7 +86,7 @@ class Rocket(Interstellar):
         else:
             # The rocket is on its way to the target
             if self.y > Const.OFF_THE_SCREEN_TOP:
-                self.speed = tuple(map(sum, zip((0, Const.ROCKET_ACCELERATION), self.speed)))
+                self.speed = (self.speed[0], self.speed[1] + Const.ROCKET_ACCELERATION)
                 self.y -= self.speed[1]
                 self.x += self.speed[0]
             else:
@@ -51,6 +96,19 @@ class Rocket(Interstellar):
         if self.is_away():
             self.reload()
 
+    def get_drawn_xy(self):
+        """
+        A rocket on board is drawn with the spaceship, see Interstellar.get_drawn_xy()
+        """
+        if self.is_launched():
+            return super().get_drawn_xy()
+        x, y = self.spaceship.get_drawn_xy()
+        if self.side == Direction.left:
+            x += Const.ROCKET_STOWED_OFFSET_X_LEFT
+        else:
+            x += Const.ROCKET_STOWED_OFFSET_X_RIGHT
+        return x, y + Const.ROCKET_STOWED_OFFSET_Y
+
     def is_launched(self):
         """
         Return true if the rocket is launched
@@ -67,31 +125,35 @@ class Rocket(Interstellar):
         """
         Return the current rocket image
         """
-        if self.on_board:
-            # The picture is static, without flame
-            self.current_pic_num = 0
-        else:
-            # Change the picture
-            if clock() > self.next_frame:
-                # Make sure we're not randomly getting the same picture
-                previous_number = self.current_pic_num
-                while previous_number == self.current_pic_num:
-                    self.current_pic_num = randint(1, len(self.images) - 1)
-                self.next_frame = clock() + Const.FRAME_TIME_SEC
         return self.images[self.current_pic_num]
 
+    def animate(self):
+        """
+        Change the flame of a launched rocket, see Animation. On board the picture is static, without flame.
+        """
+        if self.on_board:
+            return
+        # Make sure we're not randomly getting the same picture.
+        # In the precise collision mode the picture is the rocket's mask as well, and then it is a gameplay choice.
+        rng = Rng.gameplay if Const.PRECISE_COLLISION else Rng.cosmetic
+        previous_number = self.current_pic_num
+        while previous_number == self.current_pic_num:
+            self.current_pic_num = rng.randint(1, len(self.images) - 1)
+        Animation.schedule(self, Const.FRAME_TIME_SEC)
+
     def launch(self):
         """
         Launch the rocket - means detach it from the spaceship
         """
         if self.on_board:
             # Set the rocket angle depending on direction
-            angle = -self.speed[0]*3
+            angle = -self.speed[0] * Const.ROCKET_ANGLE_RATIO
             if abs(angle) > 1:
-                self.images = []
-                for image in self.original_images:
-                    self.images.append(Utils.rotate(image, angle))
+                max_step = Rocket.max_angle_step()
+                step = max(-max_step, min(max_step, round(angle / Const.ROCKET_ANGLE_STEP)))
+                self.images = Rocket.atlas[step]
             self.on_board = False
+            Animation.schedule(self, 0)  # The flames are lit by the next tick
             if self.launch_sound:
                 self.launch_sound.play()
 
@@ -101,6 +163,7 @@ class Rocket(Interstellar):
         """
         self.on_board = True
         self.away = False
+        self.current_pic_num = 0
         self.images = self.original_images
         self.speed = (0, Const.ROCKET_INITIAL_SPEED)
 
@@ -108,6 +171,6 @@ class Rocket(Interstellar):
         """
         Draw the rocket
         """
-        self.spaceship.screen.window.blit(self.get_current_pic(), self.get_xy())
+        self.spaceship.screen.window.blit(self.get_current_pic(), self.get_drawn_xy())
         if Const.DEBUG:
             pygame.draw.rect(self.spaceship.screen.window, (255, 0, 0), self.hitbox, 1)
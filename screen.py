@@ -1,38 +1,67 @@
 import pygame
-from random import randint, uniform
+from rng import Rng
 from star import Star
 from planet import Planet
 from const import Const
 from resources import Resources
+from sim_clock import SimClock
 
 
 class Screen:
 
     def __init__(self):
         self.window = pygame.display.set_mode((Const.SCREEN_WIDTH, Const.SCREEN_HEIGHT))
+        Resources.display_ready()
         self.stars = []
         self.planet = None
         for i in range(Const.STAR_NUM_SMALL):
             self.stars.append(Star(images=Resources.star_small,
-                                   speed=(0, uniform(Const.STAR_SPEED_SMALL[0], Const.STAR_SPEED_SMALL[1])),
-                                   x=randint(Const.STAR_COORD_APPEAR, Const.SCREEN_WIDTH),
-                                   y=randint(Const.STAR_COORD_APPEAR, Const.SCREEN_HEIGHT)))
+                                   speed=(0, Rng.cosmetic.uniform(*Const.STAR_SPEED_SMALL)),
+                                   x=Rng.cosmetic.randint(Const.STAR_COORD_APPEAR, Const.SCREEN_WIDTH),
+                                   y=Rng.cosmetic.randint(Const.STAR_COORD_APPEAR, Const.SCREEN_HEIGHT)))
         for i in range(Const.STAR_NUM_BRIGHT):
             self.stars.append(Star(images=Resources.star_bright,
-                                   speed=(0, uniform(Const.STAR_SPEED_BRIGHT[0], Const.STAR_SPEED_BRIGHT[1])),
-                                   x=randint(Const.STAR_COORD_APPEAR, Const.SCREEN_WIDTH),
-                                   y=randint(Const.STAR_COORD_APPEAR, Const.SCREEN_HEIGHT)))
-        self.planet = Planet(images=[Resources.planets[randint(0, len(Resources.planets) - 1)]],
-                             speed=(uniform(Const.PLANET_SPEED_X[0], Const.PLANET_SPEED_X[1]),
-                                    uniform(Const.PLANET_SPEED_Y[0], Const.PLANET_SPEED_Y[1])))
-        self.planet.set_xy(x=randint(-self.planet.width//2, Const.SCREEN_WIDTH-self.planet.width//2),
-                           y=randint(-self.planet.height//2, Const.SCREEN_WIDTH-self.planet.height//2))
+                                   speed=(0, Rng.cosmetic.uniform(*Const.STAR_SPEED_BRIGHT)),
+                                   x=Rng.cosmetic.randint(Const.STAR_COORD_APPEAR, Const.SCREEN_WIDTH),
+                                   y=Rng.cosmetic.randint(Const.STAR_COORD_APPEAR, Const.SCREEN_HEIGHT)))
+        self.planet = Planet(images=[Resources.planets[Rng.cosmetic.randint(0, len(Resources.planets) - 1)]],
+                             speed=(Rng.cosmetic.uniform(Const.PLANET_SPEED_X[0], Const.PLANET_SPEED_X[1]),
+                                    Rng.cosmetic.uniform(Const.PLANET_SPEED_Y[0], Const.PLANET_SPEED_Y[1])))
+        self.kept = None  # The tick the positions of the stars were last kept at
+        self.animate()
+        self.planet.set_xy(x=Rng.cosmetic.randint(-self.planet.width//2, Const.SCREEN_WIDTH-self.planet.width//2),
+                           y=Rng.cosmetic.randint(-self.planet.height//2, Const.SCREEN_WIDTH-self.planet.height//2))
 
-    def draw(self):
-        self.window.fill(Const.BG_COLOR)
+    def animate(self):
+        """
+        Start animating the background
+        """
+        for star in self.stars:
+            star.twinkle()
+
+    def move(self):
+        """
+        Move the background by a tick. It can be moved more than once a tick, drawing blends from
+        where it was before the first of them.
+        """
+        if self.kept != SimClock.ticks:
+            self.kept = SimClock.ticks
+            for star in self.stars:
+                star.keep_position()
+            if self.planet:
+                self.planet.keep_position()
         for star in self.stars:
             star.move()
-            self.window.blit(star.get_current_pic(), star.get_xy())
         if self.planet and not self.planet.is_away():
             self.planet.move()
-            self.window.blit(self.planet.get_current_pic(), self.planet.get_xy())
+
+    def draw(self):
+        """
+        Draw the background
+        """
+        self.window.fill(Const.BG_COLOR)
+        for star in self.stars:
+            self.window.blit(star.get_current_pic(), star.get_drawn_xy())
+        if self.planet and not self.planet.is_away():
+            self.window.blit(self.planet.get_current_pic(), self.planet.get_drawn_xy(),
+                             special_flags=self.planet.blit_flags)
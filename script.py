@@ -0,0 +1,63 @@
+import pygame
+
+
+class Script:
+    """
+    Key events played at given ticks of a game. In a file there is a line per event: the tick,
+    "down" or "up", and the name of the key as pygame has it, e.g. "120 down left".
+    A script recorded of a game has the seed of its random numbers as well, on a line like "seed 1234",
+    and then replays the game exactly, see Rng.
+    """
+
+    TYPES = {"down": pygame.KEYDOWN, "up": pygame.KEYUP}
+
+    def __init__(self, steps, seed=None):
+        self.steps = sorted(steps, key=lambda step: step[0])  # (tick, type, key), in the order of the ticks
+        self.seed = seed
+        self.tick = 0
+        self.next = 0
+
+    @staticmethod
+    def load(path):
+        """
+        Return the script of a file
+        """
+        steps = []
+        seed = None
+        with open(path) as file:
+            for line in file:
+                if line.startswith("seed"):
+                    seed = int(line.split()[1])
+                elif line.strip() and not line.startswith("#"):
+                    tick, kind, name = line.split(None, 2)
+                    steps.append((int(tick), Script.TYPES[kind], pygame.key.key_code(name.strip())))
+        return Script(steps, seed)
+
+    def save(self, path):
+        """
+        Write the script to a file
+        """
+        names = {kind: name for name, kind in Script.TYPES.items()}
+        with open(path, "w") as file:
+            if self.seed is not None:
+                file.write("seed %d\n" % self.seed)
+            for tick, kind, key in self.steps:
+                file.write("%d %s %s\n" % (tick, names[kind], pygame.key.name(key)))
+
+    def record(self, tick, events):
+        """
+        Add the key events handled before the given tick
+        """
+        self.steps += [(tick, event.type, event.key) for event in events if event.type in Script.TYPES.values()]
+
+    def events(self, game):
+        """
+        Return the key events of the next tick of the game
+        """
+        events = []
+        while self.next < len(self.steps) and self.steps[self.next][0] <= self.tick:
+            _, kind, key = self.steps[self.next]
+            events.append(pygame.event.Event(kind, key=key))
+            self.next += 1
+        self.tick += 1
+        return events
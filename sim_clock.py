@@ -0,0 +1,27 @@
+from const import Const
+
+
+class SimClock:
+    """
+    The time of the game, which moves on by a fixed step with every tick of its logic, however often
+    the frames are drawn. Whatever is timed in the game reads it rather than the wall clock,
+    so the animations keep pace with the game when frames are slow.
+    """
+    step = 1 / Const.TICK_RATE  # Seconds per tick
+    ticks = 0
+    # How far the frame being drawn is from the last tick to the next one, see Interstellar.get_drawn_xy()
+    alpha = 1.0
+
+    @staticmethod
+    def now():
+        """
+        Return the game time in seconds
+        """
+        return SimClock.ticks * SimClock.step
+
+    @staticmethod
+    def advance():
+        """
+        Move on by a tick
+        """
+        SimClock.ticks += 1
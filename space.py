@@ -2,6 +2,15 @@ from screen import Screen
 from gameplay import Gameplay
 from menu import Menu
 from spaceship import Spaceship
+from resources import Resources
+from sprite_sheet import SpriteSheet
+from bundle import Bundle
+from text import Text
+from sim_clock import SimClock
+from animation import Animation
+from rng import Rng
+from script import Script
+from const import Const
 import pygame
 import enum
 
@@ -14,9 +23,12 @@ class Space(object):
         VICTORY = 3
 
     def __init__(self):
-        # Initialization
+        # Initialization, the mixer has to be set up before pygame.init() for its settings to apply
+        Space.register_backends()
+        Resources.init_audio()
         pygame.init()
         self.clock = pygame.time.Clock()
+        self.lag = 0  # Time not simulated yet, in seconds
 
         # Screen class holds the actual window and whatever is in the background, like stars and planets
         self.screen = Screen()
@@ -24,6 +36,9 @@ class Space(object):
         # The Gameplay class holds the main game business logic
         self.game = None
 
+        # Where the key events of a game are saved to, to be replayed by "python headless.py --script"
+        self.recording_path = Const.RECORDING
+
         # Menu system
         self.menu = Menu(self.screen)
 
@@ -32,25 +47,46 @@ class Space(object):
         pic_logo = pygame.image.load("res/spaceship_N_00.png")
         pygame.display.set_icon(pic_logo)
 
+        # The menu only needs the background, so the rest is loaded while the player is looking at it
+        self.loading = Resources.preload(["gameplay"], background=True)
+
         # Start running :)
         self.running = True
 
         # Start in menu state
         self.game_state = self.GameState.MENU
 
+    @staticmethod
+    def register_backends():
+        """
+        Load the frames from the bundle and the sprite sheets before the PNG files, only once however many games run
+        """
+        if not Resources.backends:
+            Resources.backends.extend([Bundle(), SpriteSheet()])
+
     def quit(self):
         """
         Getting here will cause the game loop to end
         """
+        if self.game_state == self.GameState.PLAYING:
+            self.save_recording()
         self.running = False
 
-    def start_game(self):
+    def start_game(self, seed=None):
         """
-        Initialize and start a new game
+        Initialize and start a new game, with the random numbers of the given seed, or of a random one
         """
+        Rng.start(seed)
+        # Whatever is still loading must be there before the first frame of the game
+        self.loading.join()
+        # Nothing of the last game is animated anymore
+        Animation.clear()
+        self.screen.animate()
         Spaceship.reset()
         self.game = Gameplay(self, self.screen)
         self.game.initialize_level()
+        if self.recording_path:
+            self.game.recording = Script([], Rng.seed)
         self.game_state = self.GameState.PLAYING
 
     def game_over(self):
@@ -59,6 +95,7 @@ class Space(object):
         """
         self.game_state = self.GameState.GAME_OVER
         self.menu.reset_animation()
+        self.save_recording()
 
     def victory(self):
         """
@@ -66,6 +103,14 @@ class Space(object):
         """
         self.game_state = self.GameState.VICTORY
         self.menu.reset_animation()
+        self.save_recording()
+
+    def save_recording(self):
+        """
+        Save the key events of the game, if it is recorded
+        """
+        if self.game.recording is not None:
+            self.game.recording.save(self.recording_path)
 
     def return_to_menu(self):
         """
@@ -108,24 +153,41 @@ class Space(object):
                 elif event.key == pygame.K_RETURN:
                     self.return_to_menu()
 
+    def tick(self):
+        """
+        Run the game logic by a tick
+        """
+        self.screen.move()
+        if self.game_state == self.GameState.PLAYING:
+            self.game.run()
+        SimClock.advance()
+        Animation.advance()
+
     def main(self):
         """
         Main game loop lives here
         """
 
         while self.running:
-            # Make sure the game pace is steady
-            self.clock.tick(60)
+            # The game runs by fixed ticks, as many as the time since the last frame takes, and frames are drawn
+            # as often as they can be. After a long stall only a few ticks are caught up with, rather than
+            # falling behind further with every frame.
+            self.lag += self.clock.tick(Const.FRAME_RATE) / 1000
+            self.lag = min(self.lag, Const.MAX_CATCH_UP_TICKS * SimClock.step)
 
             # Handle events based on game state
             if self.game_state == self.GameState.MENU:
                 self.handle_menu_events()
             elif self.game_state == self.GameState.PLAYING:
                 self.game.handle_events()
-                self.game.run()
             elif self.game_state in [self.GameState.GAME_OVER, self.GameState.VICTORY]:
                 self.handle_end_screen_events()
 
+            while self.lag >= SimClock.step:
+                self.lag -= SimClock.step
+                self.tick()
+            SimClock.alpha = self.lag / SimClock.step if Const.INTERPOLATION else 1.0
+
             # Draw based on game state
             self.screen.draw()
             if self.game_state == self.GameState.MENU:
@@ -139,6 +201,7 @@ class Space(object):
 
             # Update the display
             pygame.display.update()
+            Text.new_frame()
 
 
 if __name__ == '__main__':
@@ -1,18 +1,22 @@
 from math import copysign
+from weakref import WeakKeyDictionary
 from direction import Direction
-from time import perf_counter as clock
-from random import randint
+from animation import Animation
+from rng import Rng
 from resources import Resources
 from const import Const
 from interstellar import Interstellar
-from pygame import draw
+from pygame import draw, mask
 
 
 class Spaceship(Interstellar):
     """
     This class is a singleton, as in this game only one spaceship can exist
     """
+    __slots__ = ("current_acceleration", "current_speed", "current_flame_pic_num", "screen", "saved_x", "saved_y")
     __instance = None
+    # Collision masks of the spaceship pictures, by the picture itself, see FrameCache.masks
+    masks = WeakKeyDictionary()
 
     @classmethod
     def reset(cls):
@@ -38,6 +42,7 @@ class Spaceship(Interstellar):
         self.screen = screen
         self.saved_x = 0
         self.saved_y = 0
+        Animation.schedule(self, Const.FRAME_TIME_SEC)
 
     def reinitialize(self):
         """
@@ -45,6 +50,7 @@ class Spaceship(Interstellar):
         since the parent's hit method changes its basic parameters.
         """
         self.x, self.y = self.saved_x, self.saved_y
+        self.previous = None
         self.current_acceleration = 0
         self.current_speed = 0
         self.width, self.height = Resources.ship_move_right[0].get_rect().size
@@ -76,6 +82,7 @@ class Spaceship(Interstellar):
                 self.current_speed = 0
 
         # Calculate the next x axis location
+        self.keep_position()
         if 0 < self.x + self.current_speed < Const.SCREEN_WIDTH - self.width:
             self.x += self.current_speed
         else:
@@ -134,26 +141,43 @@ class Spaceship(Interstellar):
                 # Not moving
                 pic = Resources.ship_move_right[0]
         else:
-            if clock() > self.next_frame:
-                if self.frame_num < self.num_of_explosion_frames:
-                    self.frame_num += 1
-                else:
-                    self.away = True
-                    self.exploding = False
-                self.next_frame = clock() + self.frame_time
             pic = self.current_image_set[self.frame_num]
         return pic
 
+    def animate(self):
+        """
+        Advance the explosion, or change the flames, see Animation
+        """
+        if self.exploding:
+            if self.frame_num < self.num_of_explosion_frames:
+                self.frame_num += 1
+                Animation.schedule(self, self.frame_time)
+                return
+            self.away = True
+            self.exploding = False
+        # Make sure we're not randomly getting the same picture
+        previous_number = self.current_flame_pic_num
+        while previous_number == self.current_flame_pic_num:
+            self.current_flame_pic_num = Rng.cosmetic.randint(0, len(Resources.flame) - 1)
+        Animation.schedule(self, Const.FRAME_TIME_SEC)
+
+    def get_mask(self):
+        """
+        Return the mask of the current picture and its position, None while exploding
+        """
+        if self.exploding:
+            return None
+        # Picking the picture has no side effects
+        pic = self.get_current_pic()
+        pic_mask = Spaceship.masks.get(pic)
+        if pic_mask is None:
+            pic_mask = Spaceship.masks[pic] = mask.from_surface(pic)
+        return pic_mask, (int(self.x), int(self.y))
+
     def get_current_flame_pic(self):
         """
-        Returns the current flame pic and changes it for the next time
+        Returns the current flame pic
         """
-        if clock() > self.next_frame:
-            # Make sure we're not randomly getting the same picture
-            previous_number = self.current_flame_pic_num
-            while previous_number == self.current_flame_pic_num:
-                self.current_flame_pic_num = randint(0, len(Resources.flame) - 1)
-            self.next_frame = clock() + Const.FRAME_TIME_SEC
         return Resources.flame[self.current_flame_pic_num]
 
     def get_xy(self):
@@ -182,14 +206,13 @@ class Spaceship(Interstellar):
         """
         Draw itself together with the flames
         """
-        self.screen.window.blit(self.get_current_pic(), self.get_xy())
+        x, y = self.get_drawn_xy()
+        self.screen.window.blit(self.get_current_pic(), (x, y))
         if not self.exploding:
             # In case the spaceship is exploding, no need to show the flames
             self.screen.window.blit(self.get_current_flame_pic(),
-                                    (self.x + Const.SPACESHIP_FLAME_OFFSET_X_LEFT,
-                                     self.y + Const.SPACESHIP_FLAME_OFFSET_Y))
+                                    (x + Const.SPACESHIP_FLAME_OFFSET_X_LEFT, y + Const.SPACESHIP_FLAME_OFFSET_Y))
             self.screen.window.blit(self.get_current_flame_pic(),
-                                    (self.x + Const.SPACESHIP_FLAME_OFFSET_X_RIGHT,
-                                     self.y + Const.SPACESHIP_FLAME_OFFSET_Y))
+                                    (x + Const.SPACESHIP_FLAME_OFFSET_X_RIGHT, y + Const.SPACESHIP_FLAME_OFFSET_Y))
         if Const.DEBUG:
             draw.rect(self.screen.window, (255, 0, 0), self.hitbox, 1)
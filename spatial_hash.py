@@ -0,0 +1,114 @@
+import pygame
+from const import Const
+
+
+class SpatialHash:
+    """
+    A uniform grid telling which objects may be hit by a box, so that a hit test doesn't have to go
+    through every object. Objects are kept in each cell their hitbox covers, and must be moved in the
+    grid whenever their hitbox changes. Queries then do the exact test, the same pygame.Rect one
+    done everywhere else, only on the objects sharing a cell with the box.
+    Every cell also has a version, changed whenever an object enters, leaves or moves inside it,
+    so a caller can tell whether a query could give a different answer than last time, see stamp().
+    """
+
+    def __init__(self, cell_size=Const.SPATIAL_HASH_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.objects = {}
+        self.versions = {}
+        self.generation = 0
+
+    def cells_of(self, box):
+        """
+        Return the cells a box covers. Boxes without an area can't hit anything, and cover no cell.
+        """
+        rect = box if isinstance(box, pygame.Rect) else pygame.Rect(box)
+        if rect.width == 0 or rect.height == 0:
+            return ()
+        left, right = sorted((rect.x, rect.x + rect.width))
+        top, bottom = sorted((rect.y, rect.y + rect.height))
+        return tuple((column, row)
+                     for column in range(left // self.cell_size, (right - 1) // self.cell_size + 1)
+                     for row in range(top // self.cell_size, (bottom - 1) // self.cell_size + 1))
+
+    def touch(self, cells):
+        """
+        Change the version of the given cells
+        """
+        self.generation += 1
+        for cell in cells:
+            self.versions[cell] = self.generation
+
+    def add(self, obj):
+        """
+        Add an object by its current hitbox
+        """
+        box = tuple(obj.hitbox)
+        cells = self.cells_of(box)
+        self.objects[obj] = (cells, box)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(obj)
+        self.touch(cells)
+
+    def remove(self, obj):
+        """
+        Remove an object, if it is in the grid
+        """
+        cells, _ = self.objects.pop(obj, ((), None))
+        for cell in cells:
+            self.cells[cell].discard(obj)
+        self.touch(cells)
+
+    def move(self, obj):
+        """
+        Update the cells of an object after its hitbox has changed
+        """
+        if obj not in self.objects:
+            self.add(obj)
+            return
+        box = tuple(obj.hitbox)
+        old_cells, old_box = self.objects[obj]
+        if box != old_box:
+            cells = self.cells_of(box)
+            if cells != old_cells:
+                for cell in old_cells:
+                    self.cells[cell].discard(obj)
+                for cell in cells:
+                    self.cells.setdefault(cell, set()).add(obj)
+            self.objects[obj] = (cells, box)
+            self.touch(old_cells + cells)
+
+    def rebuild(self, objects):
+        """
+        Empty the grid and add the given objects
+        """
+        for cells, _ in self.objects.values():
+            self.touch(cells)
+        self.cells.clear()
+        self.objects.clear()
+        for obj in objects:
+            self.add(obj)
+
+    def stamp(self, box):
+        """
+        Return the versions of the cells a box covers. As long as the stamp of a box stays the same,
+        a query of it returns the same objects, with the same hitboxes.
+        """
+        return tuple(self.versions.get(cell, 0) for cell in self.cells_of(box))
+
+    def query(self, box):
+        """
+        Return the objects whose hitbox overlaps the box, in no particular order
+        """
+        rect = box if isinstance(box, pygame.Rect) else pygame.Rect(box)
+        candidates = set()
+        for cell in self.cells_of(rect):
+            candidates.update(self.cells.get(cell, ()))
+        return [obj for obj in candidates if rect.colliderect(obj.hitbox)]
+
+    def query_all(self, boxes):
+        """
+        Return the objects each of the boxes overlaps
+        """
+        return [self.query(box) for box in boxes]
@@ -0,0 +1,138 @@
+import json
+import os
+import threading
+import pygame
+from resources import Resources
+
+
+class SpriteSheet:
+    """
+    All the frames of the game packed into a few large sheets, with an index of where each frame is.
+    Only a handful of files are decoded, and the frames are handed out as subsurfaces of the sheets,
+    except for the RLE frame sets, which are copied out of their sheet so they can be RLE encoded.
+    The sheets are built offline by running "python sprite_sheet.py", and are not used once any of
+    the source files is newer than the index, so a stale pack can't show outdated images.
+    """
+
+    INDEX = "res/sheets.json"
+    SHEET = "res/sheet_%02d.png"
+    MAX_SIZE = 2048
+
+    def __init__(self, index=INDEX):
+        self.index_path = index
+        self.index = None
+        self.sheets = {}
+        self.lock = threading.Lock()  # Frame sets may be loaded by several threads at once
+
+    def available(self):
+        """
+        Return true if the packed sheets exist and are up to date
+        """
+        if self.index is None:
+            if not os.path.exists(self.index_path):
+                return False
+            with open(self.index_path) as index_file:
+                self.index = json.load(index_file)
+            index_time = os.path.getmtime(self.index_path)
+            if any(not os.path.exists(path) or os.path.getmtime(path) > index_time for path in self.index["frames"]):
+                self.index = {"sheets": [], "frames": {}}
+        return bool(self.index["frames"])
+
+    def sheet(self, number):
+        """
+        Return a sheet surface, converted for the display if it is already set
+        """
+        key = (number, pygame.display.get_surface() is not None)
+        with self.lock:
+            return self.__sheet(number, key)
+
+    def __sheet(self, number, key):
+        """
+        Return a sheet surface, loading and converting it if needed, with the lock held
+        """
+        if key not in self.sheets:
+            path, mode = self.index["sheets"][number]
+            if (number, False) not in self.sheets:
+                self.sheets[(number, False)] = pygame.image.load(path)
+            # RLE can't be used, since the frames share the sheet's pixels, see frames()
+            self.sheets[key] = Resources.prepare(self.sheets[(number, False)],
+                                                 Resources.OPAQUE if mode == Resources.OPAQUE else Resources.ALPHA)
+        return self.sheets[key]
+
+    def covers(self, paths):
+        """
+        Return true if all the given files are packed
+        """
+        with self.lock:
+            return self.available() and all(path in self.index["frames"] for path in paths)
+
+    def frames(self, paths, mode):
+        """
+        Return the frames of the given files as subsurfaces, or None if they aren't all packed.
+        RLE frames are copied out of the sheet and encoded on their own, as a subsurface blits without RLE.
+        """
+        if not self.covers(paths):
+            return None
+        frames = []
+        for path in paths:
+            number, x, y, width, height = self.index["frames"][path]
+            frame = self.sheet(number).subsurface((x, y, width, height))
+            if mode == Resources.RLE:
+                frame = Resources.prepare(frame.copy(), mode)
+            frames.append(frame)
+        return frames
+
+    @staticmethod
+    def pack(index=INDEX):
+        """
+        Pack all frame sets of Resources into sheets, one group of sheets per blitting mode,
+        and write them together with the index
+        """
+        images = {}
+        for name, paths in Resources.manifest.items():
+            for path in paths:
+                if path not in images:
+                    images[path] = (Resources.formats[name], pygame.image.load(path))
+        sheets = []
+        frames = {}
+        for mode in sorted(set(mode for mode, _ in images.values())):
+            # Shelf packing, the tallest frames first so every shelf wastes as little height as possible
+            paths = sorted((path for path in images if images[path][0] == mode),
+                           key=lambda path: images[path][1].get_height(), reverse=True)
+            placed = []
+            x, y, shelf_height = 0, 0, 0
+            for path in paths:
+                width, height = images[path][1].get_size()
+                if x + width > SpriteSheet.MAX_SIZE:
+                    x, y, shelf_height = 0, y + shelf_height, 0
+                if y + height > SpriteSheet.MAX_SIZE:
+                    sheets.append((mode, placed))
+                    placed = []
+                    x, y, shelf_height = 0, 0, 0
+                placed.append((path, x, y))
+                x += width
+                shelf_height = max(shelf_height, height)
+            sheets.append((mode, placed))
+        index_data = {"sheets": [], "frames": frames}
+        for number, (mode, placed) in enumerate(sheets):
+            width = max(x + images[path][1].get_width() for path, x, _ in placed)
+            height = max(y + images[path][1].get_height() for path, _, y in placed)
+            sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+            sheet.fill((0, 0, 0, 0))
+            for path, x, y in placed:
+                image = images[path][1]
+                # Blending with the transparent sheet would alter the pixels, taking the maximum copies them
+                sheet.blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                frames[path] = (number, x, y, image.get_width(), image.get_height())
+            sheet_path = SpriteSheet.SHEET % number
+            pygame.image.save(sheet, sheet_path)
+            index_data["sheets"].append((sheet_path, mode))
+        with open(index, "w") as index_file:
+            json.dump(index_data, index_file, indent=1)
+        return index_data
+
+
+if __name__ == '__main__':
+    pygame.init()
+    packed = SpriteSheet.pack()
+    print("Packed %d frames into %d sheets" % (len(packed["frames"]), len(packed["sheets"])))
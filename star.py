@@ -1,9 +1,13 @@
-from random import randint
+from rng import Rng
 from const import Const
 from interstellar import Interstellar
+from animation import Animation
+from sim_clock import SimClock
 
 
 class Star(Interstellar):
+    __slots__ = ("animate_in_progress", "animation_frame")
+
     def __init__(self, images, speed, x, y):
         super().__init__(images=images, speed=speed, x=x, y=y)
         self.animate_in_progress = False
@@ -16,12 +20,19 @@ class Star(Interstellar):
         self.y += self.speed[1]
         # The star has gone beyond the screen
         if self.y > Const.SCREEN_HEIGHT:
-            self.x = randint(Const.STAR_COORD_APPEAR, Const.SCREEN_WIDTH)
+            self.x = Rng.cosmetic.randint(Const.STAR_COORD_APPEAR, Const.SCREEN_WIDTH)
             self.y = Const.STAR_COORD_APPEAR
+            self.previous = None  # It appears at the top
 
-    def get_current_pic(self):
+    def twinkle(self):
         """
-        Return the current picture for the star.
+        Start animating at some random time, on average once in Const.STAR_ANIMATION_CHANCE ticks
+        """
+        Animation.schedule(self, Rng.cosmetic.randint(1, 2 * Const.STAR_ANIMATION_CHANCE + 1) * SimClock.step)
+
+    def animate(self):
+        """
+        Go to the next step of the animation, see Animation
         """
         if self.animate_in_progress:
             # If we're animating, go to the next step
@@ -30,8 +41,14 @@ class Star(Interstellar):
                 # If the animation ended, stop it
                 self.animation_frame = 0
                 self.animate_in_progress = False
+                self.twinkle()
+                return
         else:
-            # We may want to start the animation
-            if randint(0, Const.STAR_ANIMATION_CHANCE) == 0:
-                self.animate_in_progress = True
+            self.animate_in_progress = True
+        Animation.schedule(self, SimClock.step)
+
+    def get_current_pic(self):
+        """
+        Return the current picture for the star.
+        """
         return self.images[self.animation_frame]
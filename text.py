@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from const import Const
+from resources import Resources
+import pygame
+
+
+class Text:
+    """
+    Fonts and rendered texts, shared by the menu, the player's data and the notifications.
+    Each font is opened once per size, and a text is only rendered again when it changes, or when
+    it was evicted after not being drawn for a while.
+    """
+
+    FONT = "res/PixelEmulator-xq08.ttf"
+
+    fonts = {}
+    cache = OrderedDict()
+    # Texts rendered during the current frame, and during the last complete one
+    misses = 0
+    frame_misses = 0
+
+    @staticmethod
+    def font(size, name=FONT):
+        """
+        Return the font of the given size, opening it if needed
+        """
+        key = (name, size)
+        if key not in Text.fonts:
+            Text.fonts[key] = pygame.font.Font(name, size)
+        return Text.fonts[key]
+
+    @staticmethod
+    def render(text, size, color, scale=1, name=FONT):
+        """
+        Return the text rendered in the given font size and color, scaled by an integer factor
+        """
+        key = (name, size, text, color, scale)
+        label = Text.cache.get(key)
+        if label is None:
+            Text.misses += 1
+            label = Text.font(size, name).render(text, True, color)
+            if scale != 1:
+                width, height = label.get_rect().size
+                label = pygame.transform.scale(label, (width * scale, height * scale))
+            label = Resources.prepare(label, Resources.ALPHA)
+            Text.cache[key] = label
+            if len(Text.cache) > Const.TEXT_CACHE_SIZE:
+                Text.cache.popitem(last=False)
+        else:
+            Text.cache.move_to_end(key)
+        return label
+
+    @staticmethod
+    def new_frame():
+        """
+        Called once per frame, to start counting the misses of the next one
+        """
+        Text.frame_misses = Text.misses
+        Text.misses = 0
@@ -1,16 +1,17 @@
 import pygame
+from resources import Resources
 
 
 class Utils:
 
     @staticmethod
-    def rotate(image, angle):
+    def rotate(image, angle, mode=Resources.ALPHA):
         """
-        Rotate an image while keeping its center and size
+        Rotate an image while keeping its center and size, and prepare it for blitting
         """
         orig_rect = image.get_rect()
         rot_image = pygame.transform.rotate(image, angle)
         rot_rect = orig_rect.copy()
         rot_rect.center = rot_image.get_rect().center
         rot_image = rot_image.subsurface(rot_rect).copy()
-        return rot_image
+        return Resources.prepare(rot_image, mode)